@@ -1,162 +1,509 @@
 """Analyze and visualize benchmark results grouped by scenario."""
 
+from __future__ import annotations
+
+import argparse
+import importlib.util
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# pandas / numpy / matplotlib / pyarrow are imported where they are first
+# needed, so importing this module (e.g. only for load_results) stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.backends.backend_pdf import PdfPages
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming JSON parser for huge result files
+    ijson = None
+
+# Timing columns (seconds) that also get a precomputed "<name>_ms" column
+TIME_COLUMNS = ("write_time", "read_time", "avg_read_time")
+
+# Low-cardinality label columns stored as pandas categoricals
+CATEGORY_COLUMNS = ("backend", "scenario")
 
-import matplotlib.pyplot as plt
-import pandas as pd
+# JSON arrays above this size are streamed with ijson (if installed) instead of
+# being materialized as a list of dicts first
+STREAMING_JSON_MIN_BYTES = 256 * 1024 * 1024
+
+DEFAULT_DPI = 150
+
+# Records which results file and rendering options the outputs in a directory
+# were generated from; outputs are only reused while it matches
+STAMP_FILE = ".analyze_stamp.json"
+
+# Below this many result rows, process startup costs more than the plots
+PARALLEL_PLOT_MIN_ROWS = 50_000
+
+
+def _pyplot():
+    """Import pyplot on first use.
+
+    Returns:
+        The ``matplotlib.pyplot`` module, on the Agg backend
+    """
+    import matplotlib
+
+    # Batch analyzer that only writes files: use the non-interactive backend
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _stream_json_columns(path: Path) -> dict[str, list]:
+    """Parse a JSON array of records into per-column lists with ijson.
+
+    Only one record is alive at a time, so peak memory is the column data
+    instead of the column data plus a dict per record.
+
+    Args:
+        path: Path to a JSON array of flat, uniformly keyed records
+
+    Returns:
+        Mapping of column name to values
+    """
+    columns = {}
+    with path.open("rb") as f:
+        for record in ijson.items(f, "item", use_float=True):
+            for key, value in record.items():
+                columns.setdefault(key, []).append(value)
+    return columns
 
 
 def load_results(filename: str = "benchmark_results.json") -> pd.DataFrame:
     """Load benchmark results from JSON file.
 
+    Accepts the JSON array written by benchmark_mpi.py as well as
+    newline-delimited JSON (``.jsonl``). JSON Lines files are parsed straight
+    into Arrow columns when pyarrow is installed; very large JSON arrays are
+    streamed record by record into columns when ijson is installed.
+
     Args:
         filename: Path to results file
 
     Returns:
-        DataFrame with benchmark results
+        DataFrame with benchmark results and millisecond timing columns
     """
-    with Path(filename).open() as f:
-        data = json.load(f)
+    import pandas as pd
+
+    path = Path(filename)
+    if path.suffix == ".jsonl":
+        try:
+            import pyarrow.json as pa_json
+        except ImportError:  # optional Arrow JSON reader
+            pa_json = None
+        if pa_json is not None:
+            df = pa_json.read_json(path).to_pandas()
+        else:
+            df = pd.read_json(path, orient="records", lines=True, precise_float=True)
+    elif ijson is not None and path.stat().st_size >= STREAMING_JSON_MIN_BYTES:
+        df = pd.DataFrame(_stream_json_columns(path))
+    else:
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open() as f:
+                data = json.load(f)
+        df = pd.DataFrame(data)
+
+    # Low-cardinality labels: compare/group on integer codes, not strings
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
+
+    # Sort once so every later groupby can skip re-sorting its keys
+    df = df.sort_values(["scenario", "backend"], kind="mergesort", ignore_index=True)
+
+    # Derive throughput in one vectorized pass when the input lacks it,
+    # matching BenchmarkResult.throughput (0 for ranks that never read)
+    if "throughput" not in df:
+        throughput = df.eval("read_count / read_time")
+        df["throughput"] = throughput.where(df["read_time"] > 0, 0.0)
+
+    # Scale timings to milliseconds once instead of per plotted/printed value
+    for column in TIME_COLUMNS:
+        if column in df:
+            df[f"{column}_ms"] = df[column].to_numpy() * 1000
+
+    return df
+
+
+def _write_csv(df: pd.DataFrame, output_file: Path):
+    """Write a DataFrame to CSV, using Arrow's vectorized writer if available.
 
-    return pd.DataFrame(data)
+    Args:
+        df: DataFrame to write (index is dropped)
+        output_file: Destination CSV path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:  # optional Arrow CSV writer
+        df.to_csv(output_file, index=False)
+    else:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
 
 
-def plot_scenario_comparison(df: pd.DataFrame, output_dir: Path):
-    """Plot performance comparison grouped by scenario.
+def _write_summary(df: pd.DataFrame, output_file: Path):
+    """Write a summary table as zstd-compressed Parquet or CSV by file suffix.
 
     Args:
-        df: Results DataFrame
-        output_dir: Directory to save plots
+        df: DataFrame to write (index is dropped)
+        output_file: Destination ``.parquet`` or ``.csv`` path
     """
-    scenarios = df["scenario"].unique()
+    if output_file.suffix == ".parquet":
+        df.to_parquet(output_file, engine="pyarrow", compression="zstd", index=False)
+    else:
+        _write_csv(df, output_file)
 
-    for scenario in scenarios:
-        scenario_df = df[df["scenario"] == scenario]
 
-        # Write performance
-        write_df = scenario_df[scenario_df["rank"] == 0]
-        if not write_df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            backends = write_df["backend"].unique()
-            write_times = [
-                write_df[write_df["backend"] == b]["write_time"].iloc[0] * 1000
-                for b in backends
-            ]
-
-            ax.bar(backends, write_times)
-            ax.set_ylabel("Write Time (ms)")
-            ax.set_title(f"Write Performance - {scenario.upper()} Scenario")
-            ax.grid(axis="y", alpha=0.3)
-
-            plt.tight_layout()
-            output_file = output_dir / f"write_{scenario}.png"
-            plt.savefig(output_file, dpi=150)
-            print(f"Saved: {output_file}")
-            plt.close()
+def _is_up_to_date(output_file: Path, src_mtime: float | None) -> bool:
+    """Check whether an output file is at least as new as the results file.
 
-        # Read performance
-        read_df = scenario_df[scenario_df["rank"] != 0]
-        if not read_df.empty:
-            avg_read = (
-                read_df.groupby("backend")["avg_read_time"].mean().reset_index()
-            )
+    Args:
+        output_file: Generated plot or summary path
+        src_mtime: Results file mtime, or None to always regenerate
+
+    Returns:
+        True if the output can be reused as is
+    """
+    if src_mtime is None or not output_file.exists():
+        return False
+    return output_file.stat().st_mtime >= src_mtime
+
+
+def _render_params(results_file: str, dpi: int) -> dict:
+    """Collect everything the generated outputs depend on besides their mtime.
+
+    Args:
+        results_file: Results file the outputs are generated from
+        dpi: Image resolution for saved plots
+
+    Returns:
+        JSON-serializable parameters to compare with the stamp file
+    """
+    stat = Path(results_file).stat()
+    return {
+        "results_file": str(Path(results_file).resolve()),
+        "results_mtime_ns": stat.st_mtime_ns,
+        "results_size": stat.st_size,
+        "dpi": dpi,
+    }
+
+
+def _stamp_matches(stamp_file: Path, params: dict) -> bool:
+    """Check whether the outputs were generated with the same parameters.
+
+    Args:
+        stamp_file: Stamp written by the previous run
+        params: Parameters of this run, from _render_params
 
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(avg_read["backend"], avg_read["avg_read_time"] * 1000)
-            ax.set_ylabel("Avg Read Time (ms)")
-            ax.set_title(f"Read Performance - {scenario.upper()} Scenario")
-            ax.grid(axis="y", alpha=0.3)
+    Returns:
+        True if the stamp exists and records params
+    """
+    try:
+        return json.loads(stamp_file.read_text()) == params
+    except (OSError, ValueError):
+        return False
+
+
+def _save_bar_chart(
+    fig,
+    ax,
+    labels,
+    heights,
+    ylabel: str,
+    title: str,
+    output_file: Path,
+    dpi: int = DEFAULT_DPI,
+    src_mtime: float | None = None,
+    pdf: PdfPages | None = None,
+) -> str:
+    """Redraw the shared Axes as a bar chart and save it.
+
+    Args:
+        fig: Figure reused across all plots
+        ax: Axes reused across all plots
+        labels: Bar labels (x axis)
+        heights: Bar heights
+        ylabel: Y axis label
+        title: Plot title
+        output_file: Destination image path
+        dpi: Image resolution
+        src_mtime: Results file mtime; skip if the image is newer
+        pdf: Report to append a page to instead of writing output_file
 
-            plt.tight_layout()
-            output_file = output_dir / f"read_{scenario}.png"
-            plt.savefig(output_file, dpi=150)
-            print(f"Saved: {output_file}")
-            plt.close()
+    Returns:
+        Status line for the log
+    """
+    if pdf is None and _is_up_to_date(output_file, src_mtime):
+        return f"Up to date: {output_file}"
+
+    import numpy as np
+
+    ax.clear()
+    # Bars at integer positions with explicit tick labels: skips matplotlib's
+    # string-category unit conversion of the labels
+    x = np.arange(len(labels))
+    ax.bar(x, np.asarray(heights, dtype=float))
+    ax.set_xticks(x, [str(label) for label in labels])
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(axis="y", alpha=0.3)
+
+    fig.tight_layout()
+    if pdf is not None:
+        pdf.savefig(fig)
+        return f"Added page: {title}"
+    fig.savefig(output_file, dpi=dpi)
+    return f"Saved: {output_file}"
+
+
+def _plot_one_scenario(
+    scenario: str,
+    scenario_df: pd.DataFrame,
+    output_dir: Path,
+    dpi: int = DEFAULT_DPI,
+    src_mtime: float | None = None,
+    pdf: PdfPages | None = None,
+) -> list[str]:
+    """Render all charts of a single scenario.
+
+    Runs in a worker process: it only touches its own Figure and returns its
+    status lines so the parent prints them in a stable order.
+
+    Args:
+        scenario: Scenario name
+        scenario_df: Rows of this scenario
+        output_dir: Directory to save plots
+        dpi: Image resolution for saved plots
+        src_mtime: Results file mtime; plots newer than it are not redrawn
+        pdf: Report to append pages to instead of writing PNG files
+
+    Returns:
+        Status line of every chart, in drawing order
+    """
+    plt = _pyplot()
+
+    # One Figure/Axes pair is redrawn for every chart of the scenario
+    fig, ax = plt.subplots(figsize=(10, 6))
+    is_writer = scenario_df["rank"] == 0
+    charts = []
+
+    # Write performance
+    write_df = scenario_df[is_writer]
+    if not write_df.empty:
+        write_times = write_df.drop_duplicates("backend").set_index("backend")[
+            "write_time_ms"
+        ]
+        charts.append(
+            (
+                write_times.index,
+                write_times.values,
+                "Write Time (ms)",
+                f"Write Performance - {scenario.upper()} Scenario",
+                output_dir / f"write_{scenario}.png",
+            )
+        )
+
+    # Read performance (read time and throughput aggregated in one pass)
+    read_df = scenario_df[~is_writer]
+    if not read_df.empty:
+        read_agg = read_df.groupby("backend", sort=False, observed=True).agg(
+            avg_read=("avg_read_time_ms", "mean"),
+            throughput=("throughput", "mean"),
+        )
+        charts.append(
+            (
+                read_agg.index,
+                read_agg["avg_read"].values,
+                "Avg Read Time (ms)",
+                f"Read Performance - {scenario.upper()} Scenario",
+                output_dir / f"read_{scenario}.png",
+            )
+        )
 
         # Throughput (streaming scenario only)
-        if scenario == "streaming" and not read_df.empty:
-            avg_throughput = (
-                read_df.groupby("backend")["throughput"].mean().reset_index()
+        if scenario == "streaming":
+            charts.append(
+                (
+                    read_agg.index,
+                    read_agg["throughput"].values,
+                    "Throughput (msg/s)",
+                    "Throughput - STREAMING Scenario",
+                    output_dir / "throughput_streaming.png",
+                )
             )
 
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(avg_throughput["backend"], avg_throughput["throughput"])
-            ax.set_ylabel("Throughput (msg/s)")
-            ax.set_title("Throughput - STREAMING Scenario")
-            ax.grid(axis="y", alpha=0.3)
+    log = [_save_bar_chart(fig, ax, *chart, dpi, src_mtime, pdf) for chart in charts]
+    plt.close(fig)
+    return log
 
-            plt.tight_layout()
-            output_file = output_dir / "throughput_streaming.png"
-            plt.savefig(output_file, dpi=150)
-            print(f"Saved: {output_file}")
-            plt.close()
 
+def plot_scenario_comparison(
+    df: pd.DataFrame,
+    output_dir: Path,
+    dpi: int = DEFAULT_DPI,
+    src_mtime: float | None = None,
+    report: bool = False,
+):
+    """Plot performance comparison grouped by scenario.
 
-def generate_scenario_summary(df: pd.DataFrame, output_dir: Path):
+    Scenarios share no state, so large results render each scenario in its
+    own process. Small results are plotted sequentially, since spawning
+    workers and re-importing matplotlib would dwarf the plotting itself.
+
+    Args:
+        df: Results DataFrame
+        output_dir: Directory to save plots
+        dpi: Image resolution for saved plots
+        src_mtime: Results file mtime; plots newer than it are not redrawn
+        report: Write every chart as a page of one report.pdf instead of
+            separate PNG files
+    """
+    by_scenario = df.groupby("scenario", sort=False, observed=True)
+    if not len(by_scenario):
+        return
+    scenarios, frames = zip(*by_scenario)
+
+    if report:
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        # A single PdfPages handle cannot be shared across processes
+        report_file = output_dir / "report.pdf"
+        if _is_up_to_date(report_file, src_mtime):
+            print(f"Up to date: {report_file}")
+            return
+        with PdfPages(report_file) as pdf:
+            for scenario, scenario_df in zip(scenarios, frames):
+                for line in _plot_one_scenario(
+                    scenario, scenario_df, output_dir, dpi, pdf=pdf
+                ):
+                    print(line)
+        print(f"Saved: {report_file}")
+        return
+
+    args = (scenarios, frames, repeat(output_dir), repeat(dpi), repeat(src_mtime))
+
+    if len(df) < PARALLEL_PLOT_MIN_ROWS:
+        workers = 1
+    else:
+        workers = min(os.cpu_count() or 1, len(scenarios))
+
+    if workers == 1:
+        logs = list(map(_plot_one_scenario, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            logs = list(executor.map(_plot_one_scenario, *args))
+
+    for log in logs:
+        for line in log:
+            print(line)
+
+
+def generate_scenario_summary(
+    df: pd.DataFrame,
+    output_dir: Path,
+    src_mtime: float | None = None,
+    csv: bool = False,
+):
     """Generate summary tables grouped by scenario.
 
     Args:
         df: Results DataFrame
         output_dir: Directory to save output
+        src_mtime: Results file mtime; tables newer than it are not rewritten
+        csv: Save tables as CSV instead of Parquet
     """
+    import pandas as pd
+
+    # Parquet needs pyarrow (imported by to_parquet() only when writing);
+    # without it the tables fall back to CSV
+    have_pyarrow = importlib.util.find_spec("pyarrow") is not None
+    summary_suffix = ".csv" if csv or not have_pyarrow else ".parquet"
     scenarios = df["scenario"].unique()
+    # Split writer/reader rows once; the filtered frames are only read from
+    is_writer = df["rank"] == 0
+    writer_df = df[is_writer]
+    reader_df = df[~is_writer]
+
+    # Aggregate reader metrics for every (scenario, backend) pair in one pass
+    read_summaries = reader_df.groupby(
+        ["scenario", "backend"], sort=False, observed=True
+    ).agg(
+        {
+            "avg_read_time_ms": "mean",
+            "read_count": "sum",
+            "throughput": "mean",
+        }
+    )
+    read_scenarios = set(read_summaries.index.get_level_values("scenario"))
 
     print("\n" + "=" * 70)
     print("BENCHMARK RESULTS SUMMARY")
     print("=" * 70)
 
-    for scenario in scenarios:
-        scenario_df = df[df["scenario"] == scenario]
-
+    by_scenario = df.groupby("scenario", sort=False, observed=True)
+    for scenario, scenario_df in by_scenario:
         print(f"\n{'='*70}")
         print(f"Scenario: {scenario.upper()}")
         print(f"{'='*70}")
 
         # Write performance
-        write_df = scenario_df[scenario_df["rank"] == 0][
-            ["backend", "data_size", "write_time"]
+        write_df = scenario_df.loc[
+            scenario_df["rank"] == 0, ["backend", "data_size", "write_time_ms"]
         ]
 
         if not write_df.empty:
             print("\nWrite Performance:")
             print("-" * 70)
-            for _, row in write_df.iterrows():
+            for backend, data_size, write_time_ms in write_df.itertuples(
+                index=False, name=None
+            ):
                 print(
-                    f"  {row['backend']:15s}: {row['write_time']*1000:8.2f} ms "
-                    f"({row['data_size']} entries)"
+                    f"  {backend:15s}: {write_time_ms:8.2f} ms "
+                    f"({data_size} entries)"
                 )
 
         # Read performance
-        read_df = scenario_df[scenario_df["rank"] != 0]
-        if not read_df.empty:
-            read_summary = (
-                read_df.groupby("backend")
-                .agg(
-                    {
-                        "avg_read_time": "mean",
-                        "read_count": "sum",
-                        "throughput": "mean",
-                    }
-                )
-                .reset_index()
-            )
+        if scenario in read_scenarios:
+            read_summary = read_summaries.loc[scenario]
 
             print("\nRead Performance (averaged across readers):")
             print("-" * 70)
-            for _, row in read_summary.iterrows():
+            for backend, avg_read_ms, read_count, throughput in zip(
+                read_summary.index,
+                read_summary["avg_read_time_ms"].to_numpy(),
+                read_summary["read_count"].to_numpy(),
+                read_summary["throughput"].to_numpy(),
+            ):
                 print(
-                    f"  {row['backend']:15s}: {row['avg_read_time']*1000:8.2f} ms/read, "
-                    f"{int(row['read_count'])} total reads"
+                    f"  {backend:15s}: {avg_read_ms:8.2f} ms/read, "
+                    f"{int(read_count)} total reads"
                 )
                 if scenario == "streaming":
-                    print(f"                      Throughput: {row['throughput']:.1f} msg/s")
+                    print(f"                      Throughput: {throughput:.1f} msg/s")
 
-        # Save CSV
-        if not write_df.empty or not read_df.empty:
-            summary_file = output_dir / f"summary_{scenario}.csv"
-            scenario_df.to_csv(summary_file, index=False)
-            print(f"\nSaved detailed results to: {summary_file}")
+        # Save detailed table
+        if not write_df.empty or scenario in read_scenarios:
+            summary_file = output_dir / f"summary_{scenario}{summary_suffix}"
+            if _is_up_to_date(summary_file, src_mtime):
+                print(f"\nUp to date: {summary_file}")
+            else:
+                _write_summary(scenario_df, summary_file)
+                print(f"\nSaved detailed results to: {summary_file}")
 
     # Cross-scenario comparison
     print(f"\n{'='*70}")
@@ -164,40 +511,107 @@ def generate_scenario_summary(df: pd.DataFrame, output_dir: Path):
     print(f"{'='*70}")
 
     backends = df["backend"].unique()
+    write_pt = writer_df.pivot_table(
+        index="backend",
+        columns="scenario",
+        values="write_time_ms",
+        aggfunc="first",
+        observed=True,
+        sort=False,
+    ).reindex(index=backends, columns=scenarios)
+    read_pt = reader_df.pivot_table(
+        index="backend",
+        columns="scenario",
+        values=["avg_read_time_ms", "throughput"],
+        aggfunc="mean",
+        observed=True,
+        sort=False,
+    ).reindex(
+        index=backends,
+        columns=pd.MultiIndex.from_product(
+            [["avg_read_time_ms", "throughput"], scenarios]
+        ),
+    )
+
     for backend in backends:
-        backend_df = df[df["backend"] == backend]
         print(f"\n{backend}:")
 
         for scenario in scenarios:
-            scenario_backend_df = backend_df[backend_df["scenario"] == scenario]
-
-            write_data = scenario_backend_df[scenario_backend_df["rank"] == 0]
-            read_data = scenario_backend_df[scenario_backend_df["rank"] != 0]
+            write_ms = write_pt.at[backend, scenario]
+            avg_read_ms = read_pt.at[backend, ("avg_read_time_ms", scenario)]
 
-            if not write_data.empty:
-                write_time = write_data["write_time"].iloc[0] * 1000
-                print(f"  {scenario:12s}: Write={write_time:8.2f}ms", end="")
+            if pd.notna(write_ms):
+                print(f"  {scenario:12s}: Write={write_ms:8.2f}ms", end="")
 
-            if not read_data.empty:
-                avg_read = read_data["avg_read_time"].mean() * 1000
-                print(f", Read={avg_read:7.2f}ms", end="")
+            if pd.notna(avg_read_ms):
+                print(f", Read={avg_read_ms:7.2f}ms", end="")
 
                 if scenario == "streaming":
-                    avg_throughput = read_data["throughput"].mean()
+                    avg_throughput = read_pt.at[backend, ("throughput", scenario)]
                     print(f", Throughput={avg_throughput:6.1f}msg/s", end="")
 
             print()
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze IPC benchmark results")
+    parser.add_argument(
+        "results_file",
+        nargs="?",
+        default="benchmark_results.json",
+        help="Results file (.json array or .jsonl; default: benchmark_results.json)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("benchmark_plots"),
+        help="Directory for plots and summaries (default: benchmark_plots)",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=DEFAULT_DPI,
+        help=f"Resolution of saved plots (default: {DEFAULT_DPI})",
+    )
+    parser.add_argument(
+        "--pdf",
+        action="store_true",
+        help="Write all plots to a single report.pdf instead of PNG files",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Save summary tables as CSV instead of Parquet",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate outputs even if they are up to date with the results file",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main analysis function."""
-    results_file = "benchmark_results.json"
+    args = parse_args()
+    results_file = args.results_file
 
     if not Path(results_file).exists():
         print(f"Error: {results_file} not found")
         print("Run benchmark_mpi.py first to generate results")
         return
 
+    # Outputs newer than the results file are reused unless --force is given,
+    # or they were generated from another results file or with another --dpi
+    output_dir = args.output_dir
+    stamp_file = output_dir / STAMP_FILE
+    params = _render_params(results_file, args.dpi)
+    if args.force or not _stamp_matches(stamp_file, params):
+        src_mtime = None
+    else:
+        src_mtime = Path(results_file).stat().st_mtime
+
     # Load results
     print(f"Loading results from {results_file}...")
     df = load_results(results_file)
@@ -209,16 +623,17 @@ def main():
     print(f"MPI ranks: {sorted(df['rank'].unique())}")
 
     # Create output directory
-    output_dir = Path("benchmark_plots")
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate plots
     print("\nGenerating plots...")
-    plot_scenario_comparison(df, output_dir)
+    plot_scenario_comparison(df, output_dir, args.dpi, src_mtime, args.pdf)
 
     # Generate summary tables
     print("\nGenerating summary...")
-    generate_scenario_summary(df, output_dir)
+    generate_scenario_summary(df, output_dir, src_mtime, args.csv)
+    # Only once every output was written, so an interrupted run starts over
+    stamp_file.write_text(json.dumps(params))
 
     print(f"\n{'='*70}")
     print(f"Analysis complete! Results saved to {output_dir}/")
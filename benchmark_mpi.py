@@ -3,15 +3,17 @@
 import argparse
 import json
 import logging
-import sys
-import time
 from pathlib import Path
+from time import perf_counter_ns
 from typing import Any
 
+import numpy as np
 from mpi4py import MPI
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder for the results file
+    orjson = None
 
 from ipc_benchmark import (
     LMDBBackend,
@@ -20,7 +22,12 @@ from ipc_benchmark import (
     ZMQBackend,
 )
 from ipc_benchmark.base import IPCBackend
-from ipc_benchmark.utils import deserialize, generate_test_dict, serialize
+from ipc_benchmark.utils import (
+    cached_test_dict,
+    deserialize,
+    generate_test_arrays,
+    serialize,
+)
 
 
 class MPIRankFilter(logging.Filter):
@@ -41,15 +48,72 @@ _rank_filter = MPIRankFilter()
 logging.basicConfig(
     level=logging.INFO, format="[Rank %(rank)s] %(levelname)s: %(message)s"
 )
-logging.getLogger().addFilter(_rank_filter)
+# Handler filters see every record, including those propagated from the
+# module and backend loggers (root logger filters only see root records)
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(_rank_filter)
+
+logger = logging.getLogger(__name__)
+
+# Seconds per perf_counter_ns() tick: timed regions subtract integer
+# nanosecond counters and convert only the difference, keeping sub-microsecond
+# reads exact
+NS = 1e-9
+
+# Test payload builders by --payload name: nested dicts (default) or a NumPy
+# structured array with the same entries
+PAYLOADS = {
+    "dict": cached_test_dict,
+    "numpy": generate_test_arrays,
+}
+
+# Lead time for tight_barrier: must cover the allreduce latency on every rank
+TIGHT_BARRIER_DELAY = 1e-3  # seconds
+
+
+def tight_barrier(comm: MPI.Comm, delay: float = TIGHT_BARRIER_DELAY) -> None:
+    """Synchronize all ranks and release them at the same instant.
+
+    MPI_Barrier only guarantees no rank leaves before all arrived; ranks may
+    leave tens of microseconds apart. Here the ranks agree on a start time
+    slightly after the last arrival and busy-wait until it, so timed loops
+    begin together. All ranks run on one host (required by the shared
+    storage backends), where perf_counter_ns is a system-wide monotonic clock.
+
+    Args:
+        comm: Communicator to synchronize
+        delay: Seconds between the last arrival and the common start time
+    """
+    # Buffer-based Allreduce: no pickling of the timestamps
+    now = np.array([perf_counter_ns()], dtype=np.int64)
+    latest = np.empty(1, dtype=np.int64)
+    comm.Allreduce([now, MPI.INT64_T], [latest, MPI.INT64_T], op=MPI.MAX)
+    start_at = int(latest[0]) + round(delay / NS)
+    while perf_counter_ns() < start_at:
+        pass
+
+
+def serialize_timed(data: dict[str, Any] | np.ndarray) -> tuple[bytes, float]:
+    """Serialize data once and measure how long it took.
+
+    Args:
+        data: Test data to serialize
+
+    Returns:
+        Tuple of (serialized bytes, elapsed seconds)
+    """
+    logger.info("Serializing data...")
+    ser_start = perf_counter_ns()
+    serialized_data = serialize(data)
+    elapsed = (perf_counter_ns() - ser_start) * NS
+    logger.info("Serialization completed in %.6f seconds", elapsed)
+    return serialized_data, elapsed
 
 
 class BenchmarkResult:
     """Container for benchmark results."""
 
-    def __init__(
-        self, backend_name: str, data_size: int, rank: int, scenario: str
-    ):
+    def __init__(self, backend_name: str, data_size: int, rank: int, scenario: str):
         self.backend_name = backend_name
         self.data_size = data_size
         self.rank = rank
@@ -85,13 +149,95 @@ class BenchmarkResult:
             "deserialize_time": self.deserialize_time,
         }
 
+    def to_record(self) -> tuple:
+        """Pack the measured fields in RESULT_DTYPE field order."""
+        return (
+            self.backend_name,
+            self.data_size,
+            self.rank,
+            self.scenario,
+            self.write_time,
+            self.read_time,
+            self.read_count,
+            self.serialize_time,
+            self.deserialize_time,
+        )
+
+    @classmethod
+    def from_record(cls, record: np.void) -> "BenchmarkResult":
+        """Rebuild a result from one RESULT_DTYPE record."""
+        result = cls(
+            record["backend"].decode(),
+            int(record["data_size"]),
+            int(record["rank"]),
+            record["scenario"].decode(),
+        )
+        result.write_time = float(record["write_time"])
+        result.read_time = float(record["read_time"])
+        result.read_count = int(record["read_count"])
+        result.serialize_time = float(record["serialize_time"])
+        result.deserialize_time = float(record["deserialize_time"])
+        return result
+
+
+# Fixed-size binary layout of a BenchmarkResult for gathering without pickle
+RESULT_DTYPE = np.dtype(
+    [
+        ("backend", "S16"),
+        ("data_size", "i8"),
+        ("rank", "i4"),
+        ("scenario", "S16"),
+        ("write_time", "f8"),
+        ("read_time", "f8"),
+        ("read_count", "i8"),
+        ("serialize_time", "f8"),
+        ("deserialize_time", "f8"),
+    ]
+)
+
+
+def gather_results(
+    comm: MPI.Comm, results: list[BenchmarkResult]
+) -> list[BenchmarkResult] | None:
+    """Gather all ranks' results on rank 0 as RESULT_DTYPE records.
+
+    Uses buffer-based Gather/Gatherv instead of pickling result objects.
+
+    Args:
+        comm: Communicator to gather over
+        results: Results of the calling rank
+
+    Returns:
+        Results of all ranks in rank order on rank 0, None elsewhere
+    """
+    records = np.array([r.to_record() for r in results], dtype=RESULT_DTYPE)
+    byte_count = np.array([records.nbytes], dtype=np.int64)
+
+    if comm.Get_rank() != 0:
+        comm.Gather([byte_count, MPI.INT64_T], None, root=0)
+        comm.Gatherv([records, MPI.BYTE], None, root=0)
+        return None
+
+    byte_counts = np.empty(comm.Get_size(), dtype=np.int64)
+    comm.Gather([byte_count, MPI.INT64_T], [byte_counts, MPI.INT64_T], root=0)
+    displs = np.concatenate(([0], np.cumsum(byte_counts)[:-1]))
+    gathered = np.empty(byte_counts.sum() // RESULT_DTYPE.itemsize, RESULT_DTYPE)
+    comm.Gatherv(
+        [records, MPI.BYTE],
+        [gathered, byte_counts.tolist(), displs.tolist(), MPI.BYTE],
+        root=0,
+    )
+    return [BenchmarkResult.from_record(record) for record in gathered]
+
 
 def run_scenario_shared(
     backend: IPCBackend,
-    data: dict[str, Any] | None,
+    data: dict[str, Any] | np.ndarray | None,
     rank: int,
     size: int,
     iterations: int,
+    serialized_data: bytes | None = None,
+    serialize_time: float = 0.0,
 ) -> BenchmarkResult:
     """Scenario 1: Shared storage - write once, read N times.
 
@@ -107,83 +253,63 @@ def run_scenario_shared(
         rank: MPI rank (0 = writer)
         size: Total MPI processes
         iterations: Number of read iterations per reader
+        serialized_data: Payload already serialized by the writer (serialized
+            here when None)
+        serialize_time: Seconds spent producing serialized_data
 
     Returns:
         Benchmark results
     """
-    logger = logging.LoggerAdapter(logging.getLogger(__name__), {"rank": rank})
     comm = MPI.COMM_WORLD
-    result = BenchmarkResult(backend.get_name(), len(data or {}), rank, "shared")
+    result = BenchmarkResult(
+        backend.get_name(), 0 if data is None else len(data), rank, "shared"
+    )
     is_writer = rank == 0
 
-    # First barrier: ensure all processes are ready
-    comm.Barrier()
+    # First barrier: ensure all processes are ready, start timing together
+    tight_barrier(comm)
 
     if is_writer:
-        # Serialize once (measure separately)
-        logger.info("Serializing data...")
-        ser_start = time.perf_counter()
-        serialized_data = serialize(data)
-        result.serialize_time = time.perf_counter() - ser_start
-        logger.info("Serialization completed in %.6f seconds", result.serialize_time)
+        # Serialize once (measure separately) unless run_benchmark already did
+        if serialized_data is None:
+            serialized_data, serialize_time = serialize_timed(data)
+        result.serialize_time = serialize_time
 
         # Write (pure transport)
         logger.info("Writing data once (shared storage scenario)...")
-        start = time.perf_counter()
-        # For MPI: just store data, don't broadcast yet (collective ops happen later)
-        if backend.get_name() == "MPI-Native":
-            backend._serialized_data = serialized_data  # Store for later broadcasts
-        else:
-            backend.write_bytes(serialized_data)
-        result.write_time = time.perf_counter() - start
+        backend.prewarm(len(serialized_data))
+        start = perf_counter_ns()
+        backend.write_shared(serialized_data)
+        result.write_time = (perf_counter_ns() - start) * NS
 
         logger.info("Write completed in %.4f seconds", result.write_time)
 
         # Second barrier: signal data is ready
-        comm.Barrier()
+        tight_barrier(comm)
 
-        # For MPI backend: participate in collective ops
-        if backend.get_name() == "MPI-Native":
-            logger.info(
-                "Participating in %d collective ops (MPI backend)...", iterations
-            )
-            coll_start = time.perf_counter()
-            for _ in range(iterations):
-                backend.read_bytes()  # Trigger bcast
-            result.write_time += time.perf_counter() - coll_start
-        # For ZeroMQ: send iterations * num_readers messages
-        elif backend.get_name() == "ZeroMQ":
-            num_readers = size - 1
-            num_messages = iterations * num_readers
-            logger.info(
-                "Sending %d messages (%d readers × %d iterations)...",
-                num_messages,
-                num_readers,
-                iterations,
-            )
-            coll_start = time.perf_counter()
-            for _ in range(num_messages - 1):  # -1 because we already sent one
-                backend.write_bytes(serialized_data)
-            result.write_time += time.perf_counter() - coll_start
+        # Message-passing backends now send the copies each reader consumes
+        coll_start = perf_counter_ns()
+        backend.finalize_writer_shared(serialized_data, iterations, size - 1)
+        result.write_time += (perf_counter_ns() - coll_start) * NS
 
     else:
         # Readers: wait for data ready
-        comm.Barrier()
+        tight_barrier(comm)
 
         logger.info("Reading data %d times (shared storage scenario)...", iterations)
+        backend.prewarm()
         # Read (pure transport)
-        start = time.perf_counter()
-        for _ in range(iterations):
-            raw_bytes = backend.read_bytes()
-            if raw_bytes is not None:
-                result.read_count += 1
-        result.read_time = time.perf_counter() - start
-
-        # Deserialize once (measure separately)
-        if result.read_count > 0:
-            deser_start = time.perf_counter()
+        start = perf_counter_ns()
+        read_count, raw_bytes = backend.read_shared(iterations)
+        result.read_time = (perf_counter_ns() - start) * NS
+        result.read_count = read_count
+
+        # Deserialize once (measure separately); raw_bytes is set iff a read
+        # succeeded
+        if raw_bytes is not None:
+            deser_start = perf_counter_ns()
             _ = deserialize(raw_bytes)
-            result.deserialize_time = time.perf_counter() - deser_start
+            result.deserialize_time = (perf_counter_ns() - deser_start) * NS
 
         logger.info(
             "Read completed: %d/%d successful (%.4f seconds total, %.6f seconds avg)",
@@ -201,10 +327,12 @@ def run_scenario_shared(
 
 def run_scenario_streaming(
     backend: IPCBackend,
-    data: dict[str, Any] | None,
+    data: dict[str, Any] | np.ndarray | None,
     rank: int,
     size: int,
     iterations: int,
+    serialized_data: bytes | None = None,
+    serialize_time: float = 0.0,
 ) -> BenchmarkResult:
     """Scenario 2: Streaming - continuous write/read N messages.
 
@@ -220,75 +348,77 @@ def run_scenario_streaming(
         rank: MPI rank (0 = writer)
         size: Total MPI processes
         iterations: Number of messages to stream
+        serialized_data: Payload already serialized by the writer (serialized
+            here when None)
+        serialize_time: Seconds spent producing serialized_data
 
     Returns:
         Benchmark results
     """
-    logger = logging.LoggerAdapter(logging.getLogger(__name__), {"rank": rank})
     comm = MPI.COMM_WORLD
-    result = BenchmarkResult(backend.get_name(), len(data or {}), rank, "streaming")
+    result = BenchmarkResult(
+        backend.get_name(), 0 if data is None else len(data), rank, "streaming"
+    )
     is_writer = rank == 0
 
     # Prepare streaming
     num_readers = size - 1
     backend.prepare_stream(iterations * num_readers)
 
-    # First barrier: ensure all processes ready
-    comm.Barrier()
-
+    # Writer setup happens before the barrier: readers start timing as soon as
+    # they are released, so serialization and prewarming must not delay the
+    # first message
     if is_writer:
-        # Serialize once (measure separately)
-        logger.info("Serializing data...")
-        ser_start = time.perf_counter()
-        serialized_data = serialize(data)
-        result.serialize_time = time.perf_counter() - ser_start
-        logger.info("Serialization completed in %.6f seconds", result.serialize_time)
+        # Serialize once (measure separately) unless run_benchmark already did
+        if serialized_data is None:
+            serialized_data, serialize_time = serialize_timed(data)
+        result.serialize_time = serialize_time
+        backend.prewarm(len(serialized_data))
+    else:
+        backend.prewarm()
+
+    # First barrier: ensure all processes ready, start timing together
+    tight_barrier(comm)
 
+    if is_writer:
         logger.info("Streaming %d messages to %d readers...", iterations, num_readers)
-        start = time.perf_counter()
-
-        # For streaming backends: send iterations * num_readers messages
-        # For shared storage: just write iterations times (overwrite)
-        # For MPI: broadcast is 1-to-N, so only send iterations times (not * num_readers)
-        if backend.supports_streaming():
-            if backend.get_name() == "MPI-Native":
-                # MPI broadcast sends to ALL readers at once
-                num_messages = iterations
-            else:
-                # ZeroMQ distributes messages round-robin to readers
-                num_messages = iterations * num_readers
-
-            for i in range(num_messages):
-                backend.write_bytes(serialized_data)
-        else:
-            for i in range(iterations):
-                backend.write_bytes(serialized_data)
+        start = perf_counter_ns()
+
+        # Every reader gets iterations messages: written once for shared
+        # storage, broadcast once for MPI, sent once per reader for ZeroMQ
+        backend.write_stream(serialized_data, iterations, num_readers)
 
-        result.write_time = time.perf_counter() - start
+        result.write_time = (perf_counter_ns() - start) * NS
         logger.info("Streaming completed in %.4f seconds", result.write_time)
 
     else:
         logger.info("Consuming %d messages (streaming scenario)...", iterations)
-        # Read (pure transport)
-        start = time.perf_counter()
+        # Read (pure transport); locals keep attribute lookups out of the loop
+        read = backend.read_bytes
+        read_count = 0
         raw_bytes = None
+        start = perf_counter_ns()
 
         # All backends read iterations times
         # - MPI: participate in iterations broadcasts
         # - ZeroMQ: receive iterations messages (distributed among readers)
         # - Shared storage: read iterations times (same data)
+        # Keep the last message actually received: a trailing timeout (None)
+        # must not discard it before the deserialize measurement
         for _ in range(iterations):
-            raw_bytes = backend.read_bytes()
-            if raw_bytes is not None:
-                result.read_count += 1
+            if (message := read()) is not None:
+                raw_bytes = message
+                read_count += 1
 
-        result.read_time = time.perf_counter() - start
+        result.read_time = (perf_counter_ns() - start) * NS
+        result.read_count = read_count
 
-        # Deserialize once (measure separately)
-        if result.read_count > 0 and raw_bytes is not None:
-            deser_start = time.perf_counter()
+        # Deserialize once (measure separately); raw_bytes is set iff a read
+        # succeeded
+        if raw_bytes is not None:
+            deser_start = perf_counter_ns()
             _ = deserialize(raw_bytes)
-            result.deserialize_time = time.perf_counter() - deser_start
+            result.deserialize_time = (perf_counter_ns() - deser_start) * NS
 
         logger.info(
             "Consumed: %d/%d messages (%.4f seconds, %.1f msg/s)",
@@ -311,6 +441,7 @@ def run_benchmark(
     size: int,
     iterations: int,
     scenarios: list[str],
+    payload: str = "dict",
 ) -> list[BenchmarkResult]:
     """Run benchmark for a single backend across specified scenarios.
 
@@ -321,11 +452,11 @@ def run_benchmark(
         size: Total MPI processes
         iterations: Number of iterations/messages
         scenarios: List of scenarios to run ('shared', 'streaming')
+        payload: Test payload kind, a key of PAYLOADS
 
     Returns:
         List of benchmark results (one per scenario)
     """
-    logger = logging.LoggerAdapter(logging.getLogger(__name__), {"rank": rank})
     comm = MPI.COMM_WORLD
     results = []
     is_writer = rank == 0
@@ -333,28 +464,40 @@ def run_benchmark(
     # Initialize backend
     if is_writer:
         backend.initialize(f"bench_{data_size}", is_writer)
-        test_data = generate_test_dict(data_size)
-        logger.info("Generated test data (%d entries)", data_size)
+        test_data = PAYLOADS[payload](data_size)
+        logger.info("Prepared %s test data (%d entries)", payload, data_size)
+        # Serialize once for all scenarios instead of once per scenario
+        serialized_data, serialize_time = serialize_timed(test_data)
         comm.Barrier()
     else:
         comm.Barrier()
         backend.initialize(f"bench_{data_size}", is_writer)
         test_data = None
+        serialized_data, serialize_time = None, 0.0
 
-    comm.Barrier()
+    # Readers connect in initialize() after the barrier, so the writer waits
+    # for them here (only ZeroMQ has connections to wait for)
+    if is_writer:
+        backend.wait_for_readers(size - 1)
 
-    # Run scenarios
+    # Run scenarios (each one synchronizes on entry and exit)
     for scenario in scenarios:
         if scenario == "shared":
-            result = run_scenario_shared(backend, test_data, rank, size, iterations)
-            results.append(result)
+            run_scenario = run_scenario_shared
         elif scenario == "streaming":
-            result = run_scenario_streaming(backend, test_data, rank, size, iterations)
-            results.append(result)
+            run_scenario = run_scenario_streaming
         else:
             raise ValueError(f"Unknown scenario: {scenario}")
-
-        comm.Barrier()
+        result = run_scenario(
+            backend,
+            test_data,
+            rank,
+            size,
+            iterations,
+            serialized_data=serialized_data,
+            serialize_time=serialize_time,
+        )
+        results.append(result)
 
     # Cleanup
     backend.cleanup()
@@ -362,6 +505,53 @@ def run_benchmark(
     return results
 
 
+def print_summary(results: list[BenchmarkResult], scenarios: list[str]) -> None:
+    """Print per-scenario writer/reader statistics for every backend.
+
+    Args:
+        results: Results of all ranks
+        scenarios: Scenarios to report, in order
+    """
+    # Only rank 0 summarizes, so keep pandas out of every rank's startup
+    import pandas as pd
+
+    df = pd.DataFrame([r.to_dict() for r in results])
+    keys = ["scenario", "backend"]
+    is_writer = df["rank"] == 0
+
+    # One grouped pass each for writers and readers instead of a scan per pair
+    write_times = df[is_writer].groupby(keys, sort=False)["write_time"].first()
+    reader_stats = (
+        df[~is_writer]
+        .groupby(keys, sort=False)
+        .agg(
+            avg_read=("avg_read_time", "mean"),
+            avg_throughput=("throughput", "mean"),
+            total_reads=("read_count", "sum"),
+        )
+    )
+    backend_names = df["backend"].unique()
+
+    for scenario in scenarios:
+        print(f"\n{'='*60}")
+        print(f"Scenario: {scenario.upper()}")
+        print(f"{'='*60}")
+
+        for backend_name in backend_names:
+            key = (scenario, backend_name)
+
+            if key in write_times.index:
+                print(f"\n{backend_name}:")
+                print(f"  Write time: {write_times[key]*1000:.2f} ms")
+
+            if key in reader_stats.index:
+                stats = reader_stats.loc[key]
+                print(f"  Avg read time: {stats['avg_read']*1000:.2f} ms")
+                print(f"  Total reads: {int(stats['total_reads'])}")
+                if scenario == "streaming":
+                    print(f"  Avg throughput: {stats['avg_throughput']:.1f} msg/s")
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -391,6 +581,12 @@ def parse_args():
         default=100,
         help="Number of read iterations/messages (default: 100)",
     )
+    parser.add_argument(
+        "--payload",
+        choices=list(PAYLOADS),
+        default="dict",
+        help="Test payload: nested dicts or a NumPy structured array (default: dict)",
+    )
     return parser.parse_args()
 
 
@@ -434,7 +630,7 @@ def main():
         print(f"\n{'='*60}")
         print(f"IPC Benchmark Configuration")
         print(f"{'='*60}")
-        print(f"Data size: {args.data_size} entries")
+        print(f"Data size: {args.data_size} entries ({args.payload} payload)")
         print(f"Iterations: {args.iterations}")
         print(f"MPI processes: {size} (1 writer + {size-1} readers)")
         print(f"Scenarios: {', '.join(scenarios)}")
@@ -449,61 +645,37 @@ def main():
             print(f"Testing: {backend.get_name()}")
             print(f"{'='*60}")
 
-        comm.Barrier()
+        # run_benchmark synchronizes backend setup and every scenario itself
         results = run_benchmark(
-            backend, args.data_size, rank, size, args.iterations, scenarios
+            backend,
+            args.data_size,
+            rank,
+            size,
+            args.iterations,
+            scenarios,
+            args.payload,
         )
         all_results.extend(results)
-        comm.Barrier()
 
-    # Gather all results to rank 0
-    all_results_gathered = comm.gather(all_results, root=0)
+    # Gather all results to rank 0 (already flattened in rank order)
+    results_flat = gather_results(comm, all_results)
 
     if rank == 0:
-        # Flatten results
-        results_flat = [r for results in all_results_gathered for r in results]
-
         # Save to JSON
         output_file = Path("benchmark_results.json")
-        with output_file.open("w") as f:
-            json.dump([r.to_dict() for r in results_flat], f, indent=2)
+        records = [r.to_dict() for r in results_flat]
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+        else:
+            with output_file.open("w") as f:
+                json.dump(records, f, indent=2)
 
         print(f"\n{'='*60}")
         print(f"Results saved to {output_file}")
         print(f"{'='*60}")
 
         # Print summary grouped by scenario
-        for scenario in scenarios:
-            print(f"\n{'='*60}")
-            print(f"Scenario: {scenario.upper()}")
-            print(f"{'='*60}")
-
-            scenario_results = [r for r in results_flat if r.scenario == scenario]
-
-            for backend_name in set(r.backend_name for r in scenario_results):
-                backend_results = [
-                    r for r in scenario_results if r.backend_name == backend_name
-                ]
-
-                # Writer results
-                writer = [r for r in backend_results if r.rank == 0]
-                # Reader results
-                readers = [r for r in backend_results if r.rank != 0]
-
-                if writer:
-                    w = writer[0]
-                    print(f"\n{backend_name}:")
-                    print(f"  Write time: {w.write_time*1000:.2f} ms")
-
-                if readers:
-                    avg_read = sum(r.avg_read_time for r in readers) / len(readers)
-                    avg_throughput = sum(r.throughput for r in readers) / len(readers)
-                    total_reads = sum(r.read_count for r in readers)
-
-                    print(f"  Avg read time: {avg_read*1000:.2f} ms")
-                    print(f"  Total reads: {total_reads}")
-                    if scenario == "streaming":
-                        print(f"  Avg throughput: {avg_throughput:.1f} msg/s")
+        print_summary(results_flat, scenarios)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,10 @@ from .base import IPCBackend
 from .lmdb_backend import LMDBBackend
 from .mpi_backend import MPIBackend
 from .shm_backend import SharedMemoryBackend
-from .zmq_backend import ZMQBackend
+from .zmq_backend import AsyncZMQBackend, ZMQBackend
 
 __all__ = [
+    "AsyncZMQBackend",
     "IPCBackend",
     "LMDBBackend",
     "MPIBackend",
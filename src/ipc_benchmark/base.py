@@ -53,6 +53,124 @@ class IPCBackend(ABC):
         """
         pass
 
+    def write_batch(self, items: list[dict[str, Any]]) -> None:
+        """Write several dictionaries in order.
+
+        Message-passing backends that can hand them to the transport in one
+        call (e.g. ZeroMQ multipart) override this; the default loops write.
+
+        Args:
+            items: Dictionaries to share, one message each
+        """
+        for item in items:
+            self.write(item)
+
+    def read_batch(self, count: int) -> list[dict[str, Any]]:
+        """Read up to ``count`` dictionaries.
+
+        Args:
+            count: Number of reads
+
+        Returns:
+            Successfully read dictionaries (shorter than count on failures)
+        """
+        items = []
+        for _ in range(count):
+            item = self.read()
+            if item is not None:
+                items.append(item)
+        return items
+
+    def write_bytes_batch(self, data: bytes, count: int) -> None:
+        """Write the same raw bytes ``count`` times.
+
+        Backends that can hand several messages to the transport in one call
+        (e.g. ZeroMQ multipart) override this; the default loops write_bytes.
+
+        Args:
+            data: Pre-serialized bytes to transmit
+            count: Number of messages to send
+        """
+        for _ in range(count):
+            self.write_bytes(data)
+
+    def read_bytes_batch(self, count: int) -> list[bytes]:
+        """Read up to ``count`` raw messages.
+
+        Args:
+            count: Number of messages to read
+
+        Returns:
+            Successfully read messages (shorter than count on failures)
+        """
+        messages = []
+        for _ in range(count):
+            data = self.read_bytes()
+            if data is not None:
+                messages.append(data)
+        return messages
+
+    def write_shared(self, data: bytes) -> None:
+        """Publish the shared-scenario payload once (the timed write).
+
+        Shared storage backends store it for every reader; the default is
+        write_bytes.
+
+        Args:
+            data: Pre-serialized bytes to publish
+        """
+        self.write_bytes(data)
+
+    def finalize_writer_shared(
+        self, data: bytes, iterations: int, num_readers: int
+    ) -> None:
+        """Deliver the remaining shared-scenario copies (writer side).
+
+        Runs after the data-ready barrier. Message-passing backends send here
+        whatever read_shared() on each reader consumes; shared storage
+        backends have nothing left to do, which is the default.
+
+        Args:
+            data: Payload passed to write_shared()
+            iterations: Reads performed by every reader
+            num_readers: Number of reader processes
+        """
+        pass
+
+    def read_shared(self, iterations: int) -> tuple[int, bytes | None]:
+        """Read the shared-scenario payload ``iterations`` times (reader side).
+
+        The payload is published before readers start, so the default loop
+        keeps the None check out of the loop and validates the last read.
+
+        Args:
+            iterations: Number of reads
+
+        Returns:
+            Tuple of (successful reads, last payload read or None)
+        """
+        read = self.read_bytes
+        data = None
+        for _ in range(iterations):
+            data = read()
+        return (iterations if data is not None else 0), data
+
+    def write_stream(self, data: bytes, iterations: int, num_readers: int) -> None:
+        """Send the messages of one streaming run (writer side).
+
+        Every reader consumes ``iterations`` messages with read_bytes(). The
+        default writes ``iterations`` messages, which serves shared storage
+        backends (every reader sees each one) and broadcasts (one message
+        reaches all readers); point-to-point queues override it.
+
+        Args:
+            data: Pre-serialized bytes to transmit
+            iterations: Messages consumed by every reader
+            num_readers: Number of reader processes
+        """
+        for _ in range(iterations):
+            self.write_bytes(data)
+
     @abstractmethod
     def cleanup(self) -> None:
         """Release all resources and clean up."""
@@ -72,6 +190,30 @@ class IPCBackend(ABC):
         """
         return False
 
+    def wait_for_readers(self, num_readers: int) -> None:
+        """Block until num_readers readers can receive messages (writer side).
+
+        Called once all readers have initialized. Connection-based transports
+        wait here for their connections; the default is a no-op.
+
+        Args:
+            num_readers: Number of reader processes
+        """
+        pass
+
+    def prewarm(self, num_bytes: int | None = None) -> None:
+        """Fault in the memory a timed write/read will touch (optional hook).
+
+        Called right before timing starts so first-touch page faults are not
+        charged to the transport. Message-passing backends have no persistent
+        destination region, so the default is a no-op.
+
+        Args:
+            num_bytes: Payload size about to be written (writer), or None to
+                cover the currently stored payload (readers)
+        """
+        pass
+
     def prepare_stream(self, num_messages: int) -> None:
         """Prepare for streaming transmission (optional optimization hook).
 
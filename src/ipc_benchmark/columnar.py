@@ -0,0 +1,197 @@
+"""Columnar zero-copy layout for benchmark test dictionaries.
+
+Dictionaries shaped like the output of generate_test_dict (string keys mapping
+to {"value": int, "squared": int, "text": str, "float": float}) are stored as
+contiguous columns instead of a pickle, so a reader can expose them as typed
+memoryviews over the shared buffer without deserializing anything:
+
+    [magic:4s][n:u32]
+    [value:i64 * n][squared:i64 * n][float:f64 * n]
+    [key_offsets:u32 * (n + 1)][text_offsets:u32 * (n + 1)]
+    [key_utf8_blob][text_utf8_blob]
+
+Offsets are relative to the start of their blob, so entry i's key is
+key_blob[key_offsets[i]:key_offsets[i + 1]].
+"""
+
+import struct
+from array import array
+from collections.abc import Iterator, Mapping
+from itertools import accumulate
+from typing import Any
+
+# Pickle payloads start with the PROTO opcode (0x80), so this cannot collide
+COLUMNAR_MAGIC = b"COL1"
+COLUMNAR_HEADER_FORMAT = "4sI"
+COLUMNAR_HEADER_SIZE = 8
+
+_FIELDS = frozenset(("value", "squared", "text", "float"))
+
+
+def is_columnar(buf: memoryview) -> bool:
+    """Check whether buf starts with a columnar payload."""
+    return buf[: len(COLUMNAR_MAGIC)] == COLUMNAR_MAGIC
+
+
+def _columns(data: Any) -> tuple | None:
+    """Split data into column arrays, or None if it does not fit the layout."""
+    if type(data) is not dict:
+        return None
+    n = len(data)
+    values = array("q", bytes(8 * n))
+    squares = array("q", bytes(8 * n))
+    floats = array("d", bytes(8 * n))
+    keys: list[bytes] = []
+    texts: list[bytes] = []
+
+    try:
+        for i, (key, record) in enumerate(data.items()):
+            if (
+                type(key) is not str
+                or type(record) is not dict
+                or record.keys() != _FIELDS
+            ):
+                return None
+            value, squared = record["value"], record["squared"]
+            text, number = record["text"], record["float"]
+            if (
+                type(value) is not int
+                or type(squared) is not int
+                or type(text) is not str
+                or type(number) is not float
+            ):
+                return None
+            values[i] = value
+            squares[i] = squared
+            floats[i] = number
+            keys.append(key.encode())
+            texts.append(text.encode())
+    except OverflowError:
+        # Integer outside the int64 range
+        return None
+
+    return values, squares, floats, keys, texts
+
+
+def encode_columnar_into(data: Any, buf: memoryview) -> int | None:
+    """Encode a test dictionary into buf using the columnar layout.
+
+    Args:
+        data: Object to encode
+        buf: Writable destination (e.g. a shared memory region)
+
+    Returns:
+        Number of bytes written at the start of buf, or None if data does not
+        have the generate_test_dict shape (nothing is written then)
+
+    Raises:
+        ValueError: If the encoded data does not fit into buf
+    """
+    columns = _columns(data)
+    if columns is None:
+        return None
+    values, squares, floats, keys, texts = columns
+
+    n = len(data)
+    key_offsets = array("I", [0, *accumulate(map(len, keys))])
+    text_offsets = array("I", [0, *accumulate(map(len, texts))])
+    parts = (
+        values,
+        squares,
+        floats,
+        key_offsets,
+        text_offsets,
+        b"".join(keys),
+        b"".join(texts),
+    )
+
+    total = COLUMNAR_HEADER_SIZE + sum(memoryview(part).nbytes for part in parts)
+    if total > len(buf):
+        raise ValueError(f"Data too large: {total} bytes (max: {len(buf)})")
+
+    struct.pack_into(COLUMNAR_HEADER_FORMAT, buf, 0, COLUMNAR_MAGIC, n)
+    offset = COLUMNAR_HEADER_SIZE
+    for part in parts:
+        with memoryview(part).cast("B") as raw:
+            buf[offset : offset + raw.nbytes] = raw
+            offset += raw.nbytes
+    return offset
+
+
+class ColumnarDict(Mapping):
+    """Read-only mapping over a columnar payload, aliasing its buffer.
+
+    Construction only slices and casts the buffer; keys are decoded when the
+    mapping is first indexed or iterated, and each record is materialized on
+    access. Since nothing is copied, the contents change when the writer
+    overwrites the buffer: compare version with the backend header to detect
+    that. Call release() (or use it as a context manager) before the
+    underlying buffer is closed.
+    """
+
+    def __init__(self, buf: memoryview, version: int = 0):
+        _, n = struct.unpack_from(COLUMNAR_HEADER_FORMAT, buf, 0)
+        self.version = version
+        self._n = n
+        self._views: list[memoryview] = []
+        self._index: dict[str, int] | None = None
+
+        offset = COLUMNAR_HEADER_SIZE
+        self._value, offset = self._column(buf, offset, "q", n)
+        self._squared, offset = self._column(buf, offset, "q", n)
+        self._float, offset = self._column(buf, offset, "d", n)
+        self._key_offsets, offset = self._column(buf, offset, "I", n + 1)
+        self._text_offsets, offset = self._column(buf, offset, "I", n + 1)
+        self._keys, offset = self._column(buf, offset, "B", self._key_offsets[n])
+        self._texts, _ = self._column(buf, offset, "B", self._text_offsets[n])
+
+    def _column(
+        self, buf: memoryview, offset: int, fmt: str, count: int
+    ) -> tuple[memoryview, int]:
+        """Cast count items of fmt at offset to a typed view."""
+        end = offset + count * struct.calcsize(fmt)
+        raw = buf[offset:end]
+        view = raw.cast(fmt)
+        self._views += (view, raw)
+        return view, end
+
+    def _key(self, i: int) -> str:
+        offsets = self._key_offsets
+        return str(self._keys[offsets[i] : offsets[i + 1]], "utf-8")
+
+    def record(self, i: int) -> dict[str, Any]:
+        """Materialize the i-th entry (in insertion order) as a dict."""
+        offsets = self._text_offsets
+        return {
+            "value": self._value[i],
+            "squared": self._squared[i],
+            "text": str(self._texts[offsets[i] : offsets[i + 1]], "utf-8"),
+            "float": self._float[i],
+        }
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Materialize every entry, giving a dict that no longer aliases the buffer."""
+        return {self._key(i): self.record(i) for i in range(self._n)}
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        if self._index is None:
+            self._index = {self._key(i): i for i in range(self._n)}
+        return self.record(self._index[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._key(i) for i in range(self._n))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def release(self) -> None:
+        """Release every view into the underlying buffer."""
+        for view in self._views:
+            view.release()
+        self._views.clear()
+
+    def __enter__(self) -> "ColumnarDict":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
@@ -1,12 +1,15 @@
 """Shared memory-based IPC backend implementation."""
 
 import logging
+import mmap
 import struct
+import time
 from multiprocessing import shared_memory
 from typing import Any
 
 from .base import IPCBackend
-from .utils import deserialize, serialize
+from .columnar import ColumnarDict, encode_columnar_into, is_columnar
+from .utils import deserialize, deserialize_oob_from, is_oob, serialize_oob_into
 
 
 class _RankFilter(logging.Filter):
@@ -23,48 +26,105 @@ logger.addFilter(_RankFilter())
 
 
 class SharedMemoryBackend(IPCBackend):
-    """IPC backend using Python's multiprocessing.shared_memory."""
-
-    # Header format: 4 bytes for data size + 4 bytes for version counter
-    HEADER_SIZE = 8
-    HEADER_FORMAT = "II"  # unsigned int, unsigned int
+    """IPC backend using Python's multiprocessing.shared_memory.
+
+    By default the segment holds a single payload that every write replaces.
+    After prepare_stream() the raw-bytes API switches to a single-producer,
+    multi-consumer ring inside the same segment: each write_bytes() publishes
+    a new message into the next slot and every reader consumes all messages
+    in order instead of re-reading whatever was written last.
+    """
+
+    # Header: unsigned ints for data size, version counter and payload layout,
+    # padded to a cache line so the data region starts 64-byte aligned and the
+    # header is not on the same line as the first payload bytes
+    HEADER_SIZE = 64
+    # Payload layouts: raw bytes of write_bytes(), or the columnar / out-of-band
+    # encoding of write()
+    LAYOUT_RAW = 0
+    LAYOUT_ENCODED = 1
     DEFAULT_SIZE = 100 * 1024 * 1024  # 100MB
 
+    # Ring header after the main header: slot count, slot size, messages published
+    RING_HEADER_FORMAT = "QQQ"
+    RING_HEADER_SIZE = 64
+    RING_HEAD_OFFSET = HEADER_SIZE + 16
+    RING_BASE = HEADER_SIZE + RING_HEADER_SIZE
+    # The same fields as indices into the segment viewed as u64 words
+    RING_GEOMETRY_WORD = HEADER_SIZE // 8
+    RING_HEAD_WORD = RING_HEAD_OFFSET // 8
+    # Slot header: two u64 words, sequence (odd while being written, 2*k+2
+    # once message k is complete) + payload size
+    SLOT_HEADER_SIZE = 16
+    SLOT_ALIGN = 64
+    STREAM_TIMEOUT = 2.0  # seconds a reader waits for the next message
+
     def __init__(self, size: int = DEFAULT_SIZE):
         self._shm: shared_memory.SharedMemory | None = None
         self._name: str = ""
         self._is_writer: bool = False
         self._size = size
+        # Cached views of the header (as unsigned ints), of the data region and
+        # of the whole segment as u64 words (ring and slot headers)
+        self._header: memoryview | None = None
+        self._payload: memoryview | None = None
+        self._words: memoryview | None = None
+        # Immutable payload currently stored in the segment (writer side)
+        self._stored: bytes | None = None
+        # Header version and deserialized result of the last read() (readers),
+        # so reads of an unchanged payload skip unpickling
+        self._read_cache: tuple[int, Any] | None = None
+        # Ring state (streaming mode): expected messages (0 = disabled),
+        # geometry, and index of the next message to write/read
+        self._stream_messages = 0
+        self._ring_slots = 0
+        self._ring_slot_size = 0
+        self._ring_next = 0
 
     def initialize(self, name: str, is_writer: bool) -> None:
         self._name = name
         self._is_writer = is_writer
+        self._stream_messages = 0
+        self._read_cache = None
 
         try:
             if is_writer:
                 # Create new shared memory block
-                self._shm = shared_memory.SharedMemory(
-                    name=name, create=True, size=self._size
-                )
+                self._open(name=name, create=True, size=self._size)
                 # Initialize header: data_size=0, version=0
                 self._write_header(0, 0)
                 logger.info("SharedMemory created: %s (%d bytes)", name, self._size)
             else:
                 # Attach to existing shared memory
-                self._shm = shared_memory.SharedMemory(name=name)
+                self._open(name=name)
                 logger.info("SharedMemory attached: %s", name)
         except FileExistsError:
             # If writer finds existing shm, try to attach instead
             if is_writer:
                 logger.warning("SharedMemory already exists, attaching: %s", name)
-                self._shm = shared_memory.SharedMemory(name=name)
+                self._open(name=name)
 
-    def _write_header(self, data_size: int, version: int) -> None:
+    def _open(self, **kwargs) -> None:
+        """Open the segment and cache views of its header and data region.
+
+        The views are created once, so header accesses and payload copies do
+        not build memoryview slices or go through struct on every call.
+        """
+        self._shm = shared_memory.SharedMemory(**kwargs)
+        self._header = self._shm.buf[: self.HEADER_SIZE].cast("I")
+        self._payload = self._shm.buf[self.HEADER_SIZE :]
+        self._words = self._shm.buf[: self._shm.size // 8 * 8].cast("Q")
+
+    def _write_header(
+        self, data_size: int, version: int, layout: int = LAYOUT_RAW
+    ) -> None:
         """Write header to shared memory."""
         if not self._shm:
             raise RuntimeError("Backend not initialized")
-        header = struct.pack(self.HEADER_FORMAT, data_size, version)
-        self._shm.buf[: self.HEADER_SIZE] = header
+        header = self._header
+        header[2] = layout
+        header[0] = data_size
+        header[1] = version
 
     def _read_header(self) -> tuple[int, int]:
         """Read header from shared memory.
@@ -74,33 +134,37 @@ class SharedMemoryBackend(IPCBackend):
         """
         if not self._shm:
             raise RuntimeError("Backend not initialized")
-        header = bytes(self._shm.buf[: self.HEADER_SIZE])
-        return struct.unpack(self.HEADER_FORMAT, header)
+        header = self._header
+        return header[0], header[1]
 
     def write(self, data: dict[str, Any]) -> None:
         if not self._shm:
             raise RuntimeError("Backend not initialized")
 
-        serialized = serialize(data)
-        data_size = len(serialized)
-
-        if data_size + self.HEADER_SIZE > self._size:
-            raise ValueError(
-                f"Data too large: {data_size} bytes (max: {self._size - self.HEADER_SIZE})"
-            )
-
         # Read current version
         _, current_version = self._read_header()
 
-        # Write data
-        self._shm.buf[
-            self.HEADER_SIZE : self.HEADER_SIZE + data_size
-        ] = serialized
+        # Test dictionaries are stored as columns readers can view in place;
+        # anything else is pickled straight into the data region, with
+        # out-of-band buffers (NumPy data) copied once behind the framing
+        region = self._payload
+        data_size = encode_columnar_into(data, region)
+        if data_size is None:
+            data_size = serialize_oob_into(data, region)
 
         # Update header with new size and incremented version
-        self._write_header(data_size, current_version + 1)
+        self._write_header(data_size, current_version + 1, self.LAYOUT_ENCODED)
+        self._stored = None
 
     def read(self) -> dict[str, Any] | None:
+        """Read the stored dictionary.
+
+        Returns:
+            The stored data, copied out of the segment (a dict materialized
+            from a columnar payload, or unpickled data); None if nothing was
+            written. Every write bumps the header version, so while it is
+            unchanged the previously read object itself is returned again
+        """
         if not self._shm:
             raise RuntimeError("Backend not initialized")
 
@@ -108,19 +172,69 @@ class SharedMemoryBackend(IPCBackend):
 
         if data_size == 0:
             return None
+        cache = self._read_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        with self._payload[:data_size] as region:
+            if self._header[2] == self.LAYOUT_RAW:
+                # Raw pickle stored by write_bytes(): unpickling copies
+                # everything it builds out of the view, so no intermediate bytes
+                # copy is made
+                data = deserialize(region)
+            elif is_columnar(region):
+                with ColumnarDict(region, version) as view:
+                    data = view.to_dict()
+            elif is_oob(region):
+                data = deserialize_oob_from(region)
+            else:
+                raise RuntimeError("Unknown SharedMemory payload layout")
+        self._read_cache = (version, data)
+        return data
 
-        # Read data
-        serialized = bytes(
-            self._shm.buf[self.HEADER_SIZE : self.HEADER_SIZE + data_size]
-        )
-        return deserialize(serialized)
+    def read_view(self) -> ColumnarDict | dict[str, Any] | None:
+        """Read the stored dictionary without copying it out of the segment.
+
+        Returns:
+            A ColumnarDict over the segment if write() stored a columnar
+            payload, unpickled data whose NumPy arrays are read-only views of
+            the segment if it stored out-of-band buffers, otherwise the same
+            as read(); None if nothing was written. release() the ColumnarDict
+            and drop the arrays before cleanup(): the segment cannot be closed
+            while views of it are alive
+        """
+        if not self._shm:
+            raise RuntimeError("Backend not initialized")
+
+        data_size, version = self._read_header()
+        if data_size == 0:
+            return None
+        if self._header[2] == self.LAYOUT_ENCODED:
+            # Not cached: building the views costs no more than the lookup,
+            # and callers release() what they got
+            with self._payload[:data_size] as region:
+                if is_columnar(region):
+                    return ColumnarDict(region, version)
+                return deserialize_oob_from(region, copy=False)
+        return self.read()
 
     def write_bytes(self, data: bytes) -> None:
         if not self._shm:
             raise RuntimeError("Backend not initialized")
 
+        if self._stream_messages:
+            self._ring_write(data)
+            return
+
         data_size = len(data)
 
+        # Re-publishing the bytes object already in the segment: the data is
+        # unchanged, so only bump the version to signal a new message
+        if data is self._stored:
+            _, current_version = self._read_header()
+            self._write_header(data_size, current_version + 1)
+            return
+
         if data_size + self.HEADER_SIZE > self._size:
             raise ValueError(
                 f"Data too large: {data_size} bytes (max: {self._size - self.HEADER_SIZE})"
@@ -130,26 +244,208 @@ class SharedMemoryBackend(IPCBackend):
         _, current_version = self._read_header()
 
         # Write data
-        self._shm.buf[self.HEADER_SIZE : self.HEADER_SIZE + data_size] = data
+        self._payload[:data_size] = data
 
         # Update header with new size and incremented version
         self._write_header(data_size, current_version + 1)
+        # Only bytes are immutable; other buffers may change before the next write
+        self._stored = data if type(data) is bytes else None
 
     def read_bytes(self) -> bytes | None:
         if not self._shm:
             raise RuntimeError("Backend not initialized")
 
-        data_size, version = self._read_header()
+        if self._stream_messages:
+            return self._ring_read()
+
+        data_size, _ = self._read_header()
 
         if data_size == 0:
             return None
+        if self._header[2] != self.LAYOUT_RAW:
+            # write() stores an encoding of its own, not a pickle
+            raise RuntimeError("Payload was stored by write(), read it with read()")
 
         # Read data
-        return bytes(self._shm.buf[self.HEADER_SIZE : self.HEADER_SIZE + data_size])
+        return bytes(self._payload[:data_size])
+
+    def read_shared(self, iterations: int) -> tuple[int, bytes | None]:
+        """Copy the stored payload out iterations times into one buffer.
+
+        Each iteration still checks the header and copies the whole payload,
+        but into a preallocated buffer through a cached source view, so the
+        loop is a plain memcpy without allocating a bytes object, slicing the
+        segment or looking up attributes per read.
+        """
+        if not self._shm:
+            raise RuntimeError("Backend not initialized")
+
+        if self._stream_messages:
+            return super().read_shared(iterations)
+
+        header = self._header
+        source = dest = memoryview(b"")
+        for _ in range(iterations):
+            data_size = header[0]
+            if data_size != len(dest):
+                # Payload replaced by one of another size (once per run here)
+                source = self._payload[:data_size]
+                dest = memoryview(bytearray(data_size))
+            dest[:] = source
+        # An export left on the segment would make cleanup()'s close() fail
+        source.release()
+
+        if not len(dest):
+            return 0, None
+        return iterations, dest
+
+    def _ring_setup(self, data_size: int) -> None:
+        """Fix the ring geometry for messages of data_size bytes (writer).
+
+        Uses as many slots of the (aligned) message size as the segment
+        holds, up to the expected number of messages.
+        """
+        slot_size = -(-(self.SLOT_HEADER_SIZE + data_size) // self.SLOT_ALIGN)
+        slot_size *= self.SLOT_ALIGN
+        fit = (self._shm.size - self.RING_BASE) // slot_size
+        if fit == 0:
+            raise ValueError(
+                f"Data too large: {data_size} bytes "
+                f"(max: {self._shm.size - self.RING_BASE - self.SLOT_HEADER_SIZE})"
+            )
+        self._ring_slots = min(self._stream_messages, fit)
+        self._ring_slot_size = slot_size
+        self._words[self.RING_GEOMETRY_WORD] = self._ring_slots
+        self._words[self.RING_GEOMETRY_WORD + 1] = slot_size
+
+    def _ring_write(self, data: bytes) -> None:
+        """Publish data as the next ring message.
+
+        Ring and slot headers are 8-byte aligned u64 fields, accessed through
+        the cached word view instead of struct packing.
+        """
+        buf = self._shm.buf
+        words = self._words
+        data_size = len(data)
+
+        if not self._ring_slots:
+            # Geometry is fixed by the first message (or by prewarm)
+            self._ring_setup(data_size)
+        elif self.SLOT_HEADER_SIZE + data_size > self._ring_slot_size:
+            raise ValueError(
+                f"Data too large for ring slot: {data_size} bytes "
+                f"(max: {self._ring_slot_size - self.SLOT_HEADER_SIZE})"
+            )
+
+        index = self._ring_next
+        offset = self.RING_BASE + (index % self._ring_slots) * self._ring_slot_size
+        start = offset + self.SLOT_HEADER_SIZE
+        slot = offset // 8
+
+        # Odd sequence marks the slot as being written, then copy, then commit
+        words[slot] = 2 * index + 1
+        words[slot + 1] = data_size
+        buf[start : start + data_size] = data
+        words[slot] = 2 * index + 2
+
+        self._ring_next = index + 1
+        words[self.RING_HEAD_WORD] = self._ring_next
+
+    def _ring_read(self) -> bytes | None:
+        """Consume the next ring message, waiting up to STREAM_TIMEOUT for it.
+
+        Returns:
+            Message bytes, or None on timeout or if the writer overwrote the
+            message before it could be copied (reader too slow)
+        """
+        buf = self._shm.buf
+        words = self._words
+        head_word = self.RING_HEAD_WORD
+        index = self._ring_next
+
+        if words[head_word] <= index:
+            deadline = time.perf_counter() + self.STREAM_TIMEOUT
+            while words[head_word] <= index:
+                if time.perf_counter() > deadline:
+                    return None
+
+        if not self._ring_slots:
+            self._ring_slots = words[self.RING_GEOMETRY_WORD]
+            self._ring_slot_size = words[self.RING_GEOMETRY_WORD + 1]
+
+        offset = self.RING_BASE + (index % self._ring_slots) * self._ring_slot_size
+        start = offset + self.SLOT_HEADER_SIZE
+        slot = offset // 8
+        expected = 2 * index + 2
+
+        if words[slot] == expected:
+            data = bytes(buf[start : start + words[slot + 1]])
+            # Unchanged sequence after the copy: the slot was not reused meanwhile
+            if words[slot] == expected:
+                self._ring_next = index + 1
+                return data
+
+        # Overrun: skip to the oldest message still held by the ring
+        head = words[head_word]
+        self._ring_next = max(index + 1, head - self._ring_slots)
+        logger.warning(
+            "SharedMemory ring overrun: message %d overwritten, resuming at %d",
+            index,
+            self._ring_next,
+        )
+        return None
+
+    def prewarm(self, num_bytes: int | None = None) -> None:
+        """Touch one byte per page of the data region.
+
+        The writer writes each byte back unchanged (write faults, no data is
+        modified); readers only load them. In streaming mode the writer sets
+        up the ring for num_bytes messages and touches every slot, while
+        readers skip it since the ring geometry is not published yet.
+        """
+        if not self._shm:
+            raise RuntimeError("Backend not initialized")
+
+        if self._stream_messages:
+            if not self._is_writer or num_bytes is None:
+                return
+            if not self._ring_slots:
+                self._ring_setup(num_bytes)
+            end = self.RING_BASE + self._ring_slots * self._ring_slot_size
+        else:
+            if num_bytes is None:
+                num_bytes, _ = self._read_header()
+            end = min(self.HEADER_SIZE + num_bytes, self._shm.size)
+
+        with (
+            self._shm.buf[self.HEADER_SIZE : end] as region,
+            region[:: mmap.PAGESIZE] as pages,
+        ):
+            if self._is_writer:
+                pages[:] = bytes(pages)
+            else:
+                bytes(pages)
 
     def cleanup(self) -> None:
+        self._stored = None
+        # A cached out-of-band result would keep views of the segment alive
+        self._read_cache = None
         if self._shm:
-            self._shm.close()
+            # Exported views would make close() fail
+            self._header.release()
+            self._payload.release()
+            self._words.release()
+            self._header = self._payload = self._words = None
+            try:
+                self._shm.close()
+            except BufferError:
+                # A caller still holds a view (e.g. an unreleased read_view()):
+                # the mapping lives on until it is dropped, but the segment is
+                # still unlinked below
+                logger.warning(
+                    "SharedMemory %s still has exported views, left mapped",
+                    self._name,
+                )
 
             # Only unlink if writer
             if self._is_writer:
@@ -167,3 +463,26 @@ class SharedMemoryBackend(IPCBackend):
     def supports_streaming(self) -> bool:
         """SharedMemory uses shared storage model, not optimized for streaming."""
         return False
+
+    def prepare_stream(self, num_messages: int) -> None:
+        """Switch write_bytes/read_bytes to the message ring.
+
+        Must be called on every rank before the stream starts; the writer
+        resets the ring so no message of an earlier stream is visible.
+
+        Args:
+            num_messages: Upper bound on messages in the stream (caps slots)
+        """
+        if not self._shm:
+            raise RuntimeError("Backend not initialized")
+
+        self._stream_messages = max(num_messages, 1)
+        self._ring_slots = 0
+        self._ring_slot_size = 0
+        self._ring_next = 0
+        self._stored = None
+        if self._is_writer:
+            struct.pack_into(
+                self.RING_HEADER_FORMAT, self._shm.buf, self.HEADER_SIZE, 0, 0, 0
+            )
+        logger.info("SharedMemory ring prepared for %d messages", num_messages)
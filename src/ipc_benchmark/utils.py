@@ -1,6 +1,9 @@
 """Utility functions for serialization and data generation."""
 
+import functools
 import pickle
+import struct
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -16,16 +19,140 @@ def serialize(data: dict[str, Any]) -> bytes:
     return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
 
-def deserialize(data: bytes) -> dict[str, Any]:
+class _BufferWriter:
+    """File-like sink that copies pickle output into a preallocated buffer."""
+
+    def __init__(self, buf: memoryview):
+        self._buf = buf
+        self.offset = 0
+
+    def write(self, chunk) -> int:
+        size = len(chunk)
+        end = self.offset + size
+        if end > len(self._buf):
+            raise ValueError(
+                f"Data too large: more than {len(self._buf)} bytes available"
+            )
+        self._buf[self.offset : end] = chunk
+        self.offset = end
+        return size
+
+
+def serialize_oob(data: dict[str, Any]) -> tuple[bytes, list[pickle.PickleBuffer]]:
+    """Serialize dictionary with pickle protocol 5 out-of-band buffers.
+
+    Objects exposing large contiguous buffers (e.g. NumPy arrays, PickleBuffer
+    wrapped bytes) are not copied into the payload; their buffers are returned
+    separately so a backend can transmit them without an intermediate copy.
+
+    Args:
+        data: Dictionary to serialize
+
+    Returns:
+        Tuple of (pickle payload, out-of-band buffers in pickling order)
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    return payload, buffers
+
+
+# Layout written by serialize_oob_into:
+#   [magic:4s][buffer count:u32][framing length:u64][pickle framing]
+#   [(offset, length):u64 pairs, 8-byte aligned][buffers, OOB_ALIGN aligned]
+# Offsets are relative to the start of the layout.
+OOB_MAGIC = b"OOB1"
+_OOB_HEADER = struct.Struct("4sIQ")
+_OOB_ENTRY = struct.Struct("QQ")
+OOB_ALIGN = 64
+
+
+def serialize_oob_into(data: Any, buf: memoryview) -> int:
+    """Serialize with pickle protocol 5 into buf, out-of-band buffers included.
+
+    The pickler streams its framing straight into buf, without building a
+    bytes object of it first, and every out-of-band buffer (e.g. NumPy array
+    data) is copied once to an aligned slot behind it, so neither side needs
+    an intermediate copy of the full payload. Data without such buffers costs
+    a 16-byte header.
+
+    Args:
+        data: Object to serialize
+        buf: Writable destination (e.g. a shared memory region)
+
+    Returns:
+        Number of bytes written at the start of buf
+
+    Raises:
+        ValueError: If the serialized data does not fit into buf
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    writer = _BufferWriter(buf)
+    writer.offset = _OOB_HEADER.size
+    pickle.Pickler(writer, protocol=5, buffer_callback=buffers.append).dump(data)
+    framing_size = writer.offset - _OOB_HEADER.size
+
+    table = -(-writer.offset // 8) * 8
+    end = table + len(buffers) * _OOB_ENTRY.size
+    slots = []
+    for pickle_buffer in buffers:
+        offset = -(-end // OOB_ALIGN) * OOB_ALIGN
+        end = offset + pickle_buffer.raw().nbytes
+        slots.append((offset, end))
+    if end > len(buf):
+        raise ValueError(f"Data too large: {end} bytes (max: {len(buf)})")
+
+    for i, (pickle_buffer, (offset, end)) in enumerate(zip(buffers, slots)):
+        with pickle_buffer.raw() as raw:
+            buf[offset:end] = raw
+        _OOB_ENTRY.pack_into(buf, table + i * _OOB_ENTRY.size, offset, end - offset)
+
+    _OOB_HEADER.pack_into(buf, 0, OOB_MAGIC, len(buffers), framing_size)
+    return end
+
+
+def is_oob(buf: memoryview) -> bool:
+    """Check whether buf starts with a serialize_oob_into layout."""
+    return buf[: len(OOB_MAGIC)] == OOB_MAGIC
+
+
+def deserialize_oob_from(buf: memoryview, copy: bool = True) -> Any:
+    """Deserialize a serialize_oob_into layout.
+
+    Args:
+        buf: Buffer holding the layout at its start
+        copy: Copy every out-of-band buffer out of buf. If False they are
+            handed to pickle as read-only views of buf instead, so
+            reconstructed NumPy arrays alias it: they must be dropped before
+            buf's owner (e.g. a shared memory segment) is closed
+
+    Returns:
+        Deserialized object
+    """
+    _, count, framing_size = _OOB_HEADER.unpack_from(buf, 0)
+    start = _OOB_HEADER.size
+    table = -(-(start + framing_size) // 8) * 8
+    views = []
+    for i in range(count):
+        offset, length = _OOB_ENTRY.unpack_from(buf, table + i * _OOB_ENTRY.size)
+        view = buf[offset : offset + length]
+        views.append(bytearray(view) if copy else view.toreadonly())
+    with buf[start : start + framing_size] as framing:
+        return pickle.loads(framing, buffers=views)
+
+
+def deserialize(
+    data: bytes | memoryview, buffers: Iterable[Any] | None = None
+) -> dict[str, Any]:
     """Deserialize bytes to dictionary using pickle.
 
     Args:
-        data: Serialized bytes
+        data: Serialized bytes (or any buffer, e.g. a memoryview)
+        buffers: Out-of-band buffers produced by serialize_oob, if any
 
     Returns:
         Deserialized dictionary
     """
-    return pickle.loads(data)
+    return pickle.loads(data, buffers=buffers)
 
 
 def generate_test_dict(size: int) -> dict[str, Any]:
@@ -46,3 +173,97 @@ def generate_test_dict(size: int) -> dict[str, Any]:
         }
         for i in range(size)
     }
+
+
+def _decimal_strings(size: int) -> Any:
+    """Return str(i) for i in range(size) as a fixed-width NumPy unicode array.
+
+    Equivalent to np.arange(size).astype(f"U{width}"), which formats every
+    integer separately. Instead, the digits of each decimal place of 0, 1, 2, ...
+    are a repeating ramp "0"-"9" (each repeated 10**place times), so the
+    UCS-4 code points are written column by column with array copies only.
+
+    Args:
+        size: Number of strings, for the integers 0 to size - 1
+
+    Returns:
+        Array of shape (size,) and dtype U<width>, width being the digit
+        count of size - 1
+    """
+    import numpy as np
+
+    width = len(str(max(size - 1, 0)))
+    codes = np.zeros((size, width), dtype=np.uint32)
+    ramp = np.arange(ord("0"), ord("9") + 1, dtype=np.uint32)
+    places = [
+        np.resize(np.repeat(ramp[: -(-size // 10**place)], 10**place), size)
+        for place in range(width)
+    ]
+    # Numbers with the same digit count form one contiguous range, in which
+    # place k fills column digits - 1 - k
+    start = 0
+    for digits in range(1, width + 1):
+        stop = min(10**digits, size)
+        for place in range(digits):
+            codes[start:stop, digits - 1 - place] = places[place][start:stop]
+        start = stop
+    return codes.view(f"U{width}").ravel()
+
+
+def generate_test_arrays(size: int) -> Any:
+    """Generate the entries of generate_test_dict as a NumPy structured array.
+
+    One record per entry with the key stored alongside the values. Built with
+    vectorized operations instead of per-entry dicts, and pickled as a single
+    contiguous buffer rather than a tree of small objects.
+
+    Args:
+        size: Number of entries
+
+    Returns:
+        Structured array with fields key, value, squared, text and float
+    """
+    # Only the NumPy payload needs numpy; the backends do not depend on it
+    import numpy as np
+
+    index = np.arange(size, dtype=np.int64)
+    # Fixed-width strings sized to the widest index, not numpy's default
+    digits = _decimal_strings(size)
+    keys = np.char.add("key_", digits)
+    texts = np.char.add("test_value_", digits)
+
+    arr = np.empty(
+        size,
+        dtype=[
+            ("key", keys.dtype),
+            ("value", np.int64),
+            ("squared", np.int64),
+            ("text", texts.dtype),
+            ("float", np.float64),
+        ],
+    )
+    arr["key"] = keys
+    arr["value"] = index
+    arr["squared"] = index * index
+    arr["text"] = texts
+    arr["float"] = index / 3.0
+    return arr
+
+
+@functools.cache
+def cached_test_dict(size: int) -> dict[str, Any]:
+    """Return the test dictionary of specified size, generating it once per process.
+
+    Every backend of a run benchmarks the very same dictionary without paying
+    for generation again. It is kept in memory only: a pickle cache on disk
+    would be no faster to load than generating the data, and unpickling a
+    file from a shared directory would run whatever code it contains.
+    Callers must not modify the returned dictionary.
+
+    Args:
+        size: Number of key-value pairs
+
+    Returns:
+        Test dictionary as produced by generate_test_dict
+    """
+    return generate_test_dict(size)
@@ -1,15 +1,17 @@
 """ZeroMQ-based IPC backend implementation."""
 
 import logging
+import os
 import tempfile
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import zmq
 
 from .base import IPCBackend
-from .utils import deserialize, serialize
+from .utils import deserialize, serialize_oob
 
 
 class _RankFilter(logging.Filter):
@@ -24,6 +26,10 @@ class _RankFilter(logging.Filter):
 logger = logging.getLogger(__name__)
 logger.addFilter(_RankFilter())
 
+# I/O threads of the process-wide context shared by all ZMQBackend sockets;
+# a PUSH socket spreads its reader connections over them
+IO_THREADS = max(1, (os.cpu_count() or 1) // 4)
+
 
 class ZMQBackend(IPCBackend):
     """IPC backend using ZeroMQ with IPC transport (PUSH/PULL pattern).
@@ -32,87 +38,323 @@ class ZMQBackend(IPCBackend):
     Each message is consumed once. For benchmarking, this means:
     - Write sends N messages (where N = number of read iterations)
     - Each read consumes one message
+
+    The default ipc:// transport goes through a Unix domain socket and works
+    across processes. When writer and readers live in one process (e.g.
+    threads), transport="inproc" passes messages between the sockets
+    directly, without the kernel.
+
+    All backends of a process share zmq.Context.instance() (created with
+    IO_THREADS I/O threads on first use) and only own their socket, so
+    creating and cleaning up backends does not start and stop I/O threads.
     """
 
-    def __init__(self):
+    TRANSPORTS = ("ipc", "inproc")
+    # Seconds wait_for_readers() waits for the expected connections
+    READY_TIMEOUT = 10.0
+
+    # Messages per multipart send in the shared scenario
+    SHARED_BATCH_SIZE = 64
+
+    def __init__(self, transport: str = "ipc"):
+        if transport not in self.TRANSPORTS:
+            raise ValueError(
+                f"Unknown ZMQ transport: {transport!r} "
+                f"(expected one of: {', '.join(self.TRANSPORTS)})"
+            )
+        self._transport = transport
         self._context: zmq.Context | None = None
         self._socket: zmq.Socket | None = None
         self._name: str = ""
         self._is_writer: bool = False
-        self._ipc_path: str = ""
+        self._endpoint: str = ""
+        # Writer: monitor reporting completed reader handshakes, and their count
+        self._monitor: zmq.Socket | None = None
+        self._connected = 0
+        # Zero-copy Frame of the last payload sent with write_bytes*
+        self._frame: zmq.Frame | None = None
+        self._frame_data: bytes | None = None
 
     def initialize(self, name: str, is_writer: bool) -> None:
         self._name = name
         self._is_writer = is_writer
 
-        # Create IPC socket path
-        temp_dir = Path(tempfile.gettempdir())
-        self._ipc_path = f"ipc://{temp_dir}/zmq_bench_{name}.ipc"
-
-        self._context = zmq.Context()
+        if self._transport == "inproc":
+            # inproc endpoints only exist within one context: the shared one
+            self._endpoint = f"inproc://zmq_bench_{name}"
+        else:
+            # Create IPC socket path
+            temp_dir = Path(tempfile.gettempdir())
+            self._endpoint = f"ipc://{temp_dir}/zmq_bench_{name}.ipc"
+        self._context = zmq.Context.instance(io_threads=IO_THREADS)
 
         if is_writer:
             # Writer uses PUSH socket
             self._socket = self._context.socket(zmq.PUSH)
-            self._socket.bind(self._ipc_path)
-            logger.info("ZMQ PUSH socket bound to %s", self._ipc_path)
-            # Give readers time to connect
-            time.sleep(0.2)
+            # Never block or skip a reader on flow control: queued frames only
+            # reference the shared payload, so an unbounded queue is cheap
+            self._socket.setsockopt(zmq.SNDHWM, 0)
+            # Only queue messages to completed connections
+            self._socket.setsockopt(zmq.IMMEDIATE, 1)
+            # Readers are counted as their handshakes complete, instead of
+            # sleeping a fixed time for them to connect. inproc has no
+            # handshake: its connect() attaches to the bound socket directly
+            if self._transport != "inproc":
+                self._monitor = self._socket.get_monitor_socket(
+                    zmq.EVENT_HANDSHAKE_SUCCEEDED
+                )
+            self._connected = 0
+            self._socket.bind(self._endpoint)
+            logger.info("ZMQ PUSH socket bound to %s", self._endpoint)
         else:
             # Reader uses PULL socket
             self._socket = self._context.socket(zmq.PULL)
-            self._socket.connect(self._ipc_path)
+            self._socket.connect(self._endpoint)
             # Set receive timeout
             self._socket.setsockopt(zmq.RCVTIMEO, 2000)  # 2 seconds
-            logger.info("ZMQ PULL socket connected to %s", self._ipc_path)
+            logger.info("ZMQ PULL socket connected to %s", self._endpoint)
+
+    @staticmethod
+    def _frames(data: dict[str, Any]) -> list[Any]:
+        """Serialize data into the parts of one message.
+
+        The pickle framing comes first, followed by its out-of-band buffers
+        (e.g. NumPy array data) as separate parts, so they are sent from the
+        objects' own memory instead of being copied into the pickle.
+        """
+        payload, buffers = serialize_oob(data)
+        return [payload, *(buffer.raw() for buffer in buffers)]
+
+    def _recv_parts(self) -> Iterator[memoryview]:
+        """Receive following message parts lazily, as pickle asks for them."""
+        while True:
+            yield self._socket.recv(copy=False).buffer
 
     def write(self, data: dict[str, Any]) -> None:
+        """Send data as one message, out-of-band buffers as extra parts.
+
+        Parts are sent zero-copy (pyzmq still copies those below
+        zmq.COPY_THRESHOLD, where that is cheaper than tracking the buffer):
+        libzmq references the pickle bytes and the arrays' memory until the
+        message is sent, so arrays in data must not be modified meanwhile.
+        """
         if not self._socket:
             raise RuntimeError("Backend not initialized")
 
-        serialized = serialize(data)
-        self._socket.send(serialized)
+        self._socket.send_multipart(self._frames(data), copy=False)
 
     def read(self) -> dict[str, Any] | None:
+        """Receive and unpickle the next message.
+
+        Unpickles straight from libzmq's message buffers instead of copying
+        them into bytes objects first; NumPy arrays sent out-of-band are views
+        of their message part. Out-of-band parts are received only when the
+        pickle refers to them, so messages of write_batch() are still read
+        one item at a time.
+        """
         if not self._socket:
             raise RuntimeError("Backend not initialized")
 
         try:
-            serialized = self._socket.recv()
-            return deserialize(serialized)
+            frame = self._socket.recv(copy=False)
+            return deserialize(frame.buffer, self._recv_parts())
         except zmq.Again:
             # Timeout - no data available
             return None
 
+    def write_batch(self, items: list[dict[str, Any]]) -> None:
+        """Serialize items and send them as the frames of one multipart message.
+
+        The reader gets the whole batch at once (PUSH delivers a multipart
+        message to a single reader), and the per-send overhead is paid once
+        per batch. read() still consumes the frames one by one.
+        """
+        if not self._socket:
+            raise RuntimeError("Backend not initialized")
+
+        frames = [frame for item in items for frame in self._frames(item)]
+        self._socket.send_multipart(frames, copy=False)
+
+    def read_batch(self, count: int) -> list[dict[str, Any]]:
+        """Receive whole multipart messages until ``count`` items arrived."""
+        if not self._socket:
+            raise RuntimeError("Backend not initialized")
+
+        items: list[dict[str, Any]] = []
+        while len(items) < count:
+            try:
+                # Copying receive: batches are meant for small messages, for
+                # which a zero-copy Frame per part costs more than the copy
+                frames = self._socket.recv_multipart()
+            except zmq.Again:
+                # Timeout - no more data available
+                break
+            # Every item takes its out-of-band buffers from the same parts
+            parts = iter(frames)
+            for payload in parts:
+                items.append(deserialize(payload, parts))
+        return items
+
+    def _wrap(self, data: bytes) -> zmq.Frame:
+        """Return a zero-copy Frame for data, reused while the payload is unchanged.
+
+        Benchmarks send the same bytes object many times; sending one Frame
+        with copy=False only bumps a reference count instead of copying the
+        payload into a new message each time.
+        """
+        if data is not self._frame_data:
+            self._frame = zmq.Frame(data)
+            self._frame_data = data
+        return self._frame
+
     def write_bytes(self, data: bytes) -> None:
         if not self._socket:
             raise RuntimeError("Backend not initialized")
 
-        self._socket.send(data)
+        self._socket.send(self._wrap(data), copy=False)
 
-    def read_bytes(self) -> bytes | None:
+    def read_bytes(self) -> bytes | memoryview | None:
+        """Receive the next raw message.
+
+        Returns:
+            Message bytes, or None on timeout. With the inproc transport a
+            read-only view of the writer's own payload: libzmq hands the
+            message itself to the reader, so nothing is copied
+        """
         if not self._socket:
             raise RuntimeError("Backend not initialized")
 
         try:
+            if self._transport == "inproc":
+                return self._socket.recv(copy=False).buffer
             return self._socket.recv()
         except zmq.Again:
             # Timeout - no data available
             return None
 
+    def write_bytes_batch(self, data: bytes, count: int) -> None:
+        """Send ``count`` copies of data as the frames of one multipart message.
+
+        PUSH delivers a multipart message to a single reader as a unit, and
+        every frame references the same zero-copy Frame, so the payload is
+        neither copied nor crossed into C once per message.
+        """
+        if not self._socket:
+            raise RuntimeError("Backend not initialized")
+
+        self._socket.send_multipart([self._wrap(data)] * count, copy=False)
+
+    def read_bytes_batch(self, count: int) -> list[bytes | memoryview]:
+        """Receive whole multipart messages until ``count`` frames arrived.
+
+        As with read_bytes(), inproc frames are returned as views of the
+        writer's payload instead of copies.
+        """
+        if not self._socket:
+            raise RuntimeError("Backend not initialized")
+
+        inproc = self._transport == "inproc"
+        messages: list[bytes | memoryview] = []
+        while len(messages) < count:
+            try:
+                if inproc:
+                    frames = self._socket.recv_multipart(copy=False)
+                    messages.extend(frame.buffer for frame in frames)
+                else:
+                    messages.extend(self._socket.recv_multipart())
+            except zmq.Again:
+                # Timeout - no more data available
+                break
+        return messages
+
+    def finalize_writer_shared(
+        self, data: bytes, iterations: int, num_readers: int
+    ) -> None:
+        """Send the remaining iterations * num_readers - 1 messages.
+
+        PUSH round-robins whole multipart messages over the readers, so
+        rounds of one batch per reader are sent. The first reader already got
+        the message from write_shared() and is last in the round-robin order.
+        """
+        logger.info(
+            "Sending %d messages (%d readers × %d iterations)...",
+            iterations * num_readers,
+            num_readers,
+            iterations,
+        )
+        remaining = [iterations] * (num_readers - 1) + [iterations - 1]
+        while remaining[0] > 0:
+            for i, count in enumerate(remaining):
+                batch = min(count, self.SHARED_BATCH_SIZE)
+                if batch > 0:
+                    self.write_bytes_batch(data, batch)
+                    remaining[i] -= batch
+
+    def write_stream(self, data: bytes, iterations: int, num_readers: int) -> None:
+        """Send iterations messages per reader, one zero-copy send each.
+
+        PUSH hands each message to one reader, so iterations * num_readers
+        messages are needed. Unlike the shared scenario they are not grouped
+        into multipart batches: readers consume them one by one, and a
+        reader waiting for a whole batch measured lower throughput.
+        """
+        for _ in range(iterations * num_readers):
+            self.write_bytes(data)
+
+    def read_shared(self, iterations: int) -> tuple[int, bytes | None]:
+        """Drain whole multipart batches until iterations messages arrived."""
+        messages = self.read_bytes_batch(iterations)
+        return len(messages), (messages[-1] if messages else None)
+
+    def wait_for_readers(self, num_readers: int) -> None:
+        """Block until num_readers readers completed their connection handshake.
+
+        Returns as soon as the socket monitor reported them, so PUSH
+        round-robins the first messages over every reader instead of only the
+        ones already connected. Gives up with a warning after READY_TIMEOUT.
+        """
+        if self._monitor is None:
+            return
+
+        deadline = time.perf_counter() + self.READY_TIMEOUT
+        while self._connected < num_readers:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not self._monitor.poll(remaining * 1000):
+                logger.warning(
+                    "Only %d of %d ZMQ readers connected after %.0f s",
+                    self._connected,
+                    num_readers,
+                    self.READY_TIMEOUT,
+                )
+                return
+            # Only handshake events are subscribed: the event itself (two
+            # parts) needs no parsing, which zmq.utils.monitor would do
+            self._monitor.recv_multipart()
+            self._connected += 1
+        logger.info("ZMQ writer connected to %d readers", self._connected)
+
     def cleanup(self) -> None:
+        self._frame = None
+        self._frame_data = None
+
+        if self._monitor:
+            self._socket.disable_monitor()
+            self._monitor.close()
+            self._monitor = None
+
         if self._socket:
-            self._socket.close()
+            # Runs after the final barrier, when readers got every message they
+            # wait for: drop leftovers instead of keeping them queued
+            self._socket.close(linger=0)
             self._socket = None
 
-        if self._context:
-            self._context.term()
-            self._context = None
+        # The shared context outlives this backend: it is not terminated here
+        self._context = None
 
         # Clean up IPC file if writer
-        if self._is_writer and self._ipc_path:
+        if self._is_writer and self._endpoint.startswith("ipc://"):
             # Extract path from ipc:// URL
-            ipc_file = self._ipc_path.replace("ipc://", "")
+            ipc_file = self._endpoint.replace("ipc://", "")
             path = Path(ipc_file)
             if path.exists():
                 path.unlink()
@@ -127,3 +369,115 @@ class ZMQBackend(IPCBackend):
     def prepare_stream(self, num_messages: int) -> None:
         """Prepare for streaming transmission."""
         logger.info("ZMQ prepared for streaming %d messages", num_messages)
+
+
+class AsyncZMQBackend(ZMQBackend):
+    """ZMQBackend with asyncio coroutines that overlap serialization and I/O.
+
+    The synchronous IPCBackend methods are inherited unchanged. On top of
+    them, an asyncio shadow of the same socket provides awrite()/aread() and
+    the pipelined awrite_many()/aread_many(): pickling (and unpickling) runs
+    in a worker thread via asyncio.to_thread() while the previous message is
+    still being sent (or the next one received), instead of the caller
+    alternating between serde and socket calls.
+
+    Coroutines must run on one event loop; the socket is still not
+    thread-safe, so only the serde work leaves the loop's thread. The
+    overlap needs a spare core (pickle holds the GIL only while it runs
+    Python code, libzmq's I/O threads run without it); for small messages
+    the thread hand-off costs more than it hides.
+    """
+
+    def __init__(self, transport: str = "ipc"):
+        super().__init__(transport)
+        self._asocket: zmq.asyncio.Socket | None = None
+
+    def initialize(self, name: str, is_writer: bool) -> None:
+        # asyncio is only loaded by processes that use this class
+        import zmq.asyncio
+
+        super().initialize(name, is_writer)
+        # Shares the libzmq socket (and its options, e.g. RCVTIMEO) with the
+        # synchronous one, so both APIs can be mixed between coroutines
+        self._asocket = zmq.asyncio.Socket.from_socket(self._socket)
+
+    @staticmethod
+    def _load(frames: list[zmq.Frame]) -> dict[str, Any]:
+        """Unpickle one message from its parts, as read() does."""
+        return deserialize(frames[0].buffer, (frame.buffer for frame in frames[1:]))
+
+    async def awrite(self, data: dict[str, Any]) -> None:
+        """Serialize data off the event loop and send it like write()."""
+        import asyncio
+
+        if not self._asocket:
+            raise RuntimeError("Backend not initialized")
+
+        frames = await asyncio.to_thread(self._frames, data)
+        await self._asocket.send_multipart(frames, copy=False)
+
+    async def aread(self) -> dict[str, Any] | None:
+        """Receive the next message and unpickle it off the event loop."""
+        import asyncio
+
+        if not self._asocket:
+            raise RuntimeError("Backend not initialized")
+
+        try:
+            frames = await self._asocket.recv_multipart(copy=False)
+        except zmq.Again:
+            # Timeout - no data available
+            return None
+        return await asyncio.to_thread(self._load, frames)
+
+    async def awrite_many(self, items: list[dict[str, Any]]) -> None:
+        """Send items one message each, serializing the next during each send."""
+        import asyncio
+
+        if not self._asocket:
+            raise RuntimeError("Backend not initialized")
+
+        sending: asyncio.Future | None = None
+        for item in items:
+            frames = await asyncio.to_thread(self._frames, item)
+            if sending is not None:
+                await sending
+            sending = asyncio.ensure_future(
+                self._asocket.send_multipart(frames, copy=False)
+            )
+        if sending is not None:
+            await sending
+
+    async def aread_many(self, count: int) -> list[dict[str, Any]]:
+        """Receive up to count messages, unpickling each during the next receive."""
+        import asyncio
+
+        if not self._asocket:
+            raise RuntimeError("Backend not initialized")
+
+        items: list[dict[str, Any]] = []
+        if count <= 0:
+            return items
+        receiving = asyncio.ensure_future(self._asocket.recv_multipart(copy=False))
+        while True:
+            try:
+                frames = await receiving
+            except zmq.Again:
+                # Timeout - no more data available
+                break
+            if len(items) + 1 < count:
+                receiving = asyncio.ensure_future(
+                    self._asocket.recv_multipart(copy=False)
+                )
+            items.append(await asyncio.to_thread(self._load, frames))
+            if len(items) == count:
+                break
+        return items
+
+    def cleanup(self) -> None:
+        # A shadow: closing the synchronous socket closes the libzmq one
+        self._asocket = None
+        super().cleanup()
+
+    def get_name(self) -> str:
+        return "ZeroMQ (asyncio)"
@@ -1,13 +1,10 @@
 """Minimal test to debug MPI streaming deadlock."""
 
 import sys
-from pathlib import Path
 from mpi4py import MPI
 
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from ipc_benchmark import MPIBackend
-from ipc_benchmark.utils import serialize, generate_test_dict
+from ipc_benchmark.utils import deserialize, serialize, generate_test_dict
 
 comm = MPI.COMM_WORLD
 rank = comm.Get_rank()
@@ -37,23 +34,68 @@ comm.Barrier()
 # Test streaming with 5 messages
 iterations = 5
 
+# The first message is a blocking broadcast, which also tells the reader the
+# payload size; the rest are all posted as nonblocking broadcasts up front and
+# completed together, so they are in flight at the same time
 if is_writer:
     serialized = serialize(data)
     print(f"[Rank {rank}] Starting to send {iterations} messages...")
-    for i in range(iterations):
-        print(f"[Rank {rank}] Sending message {i+1}/{iterations}")
-        backend.write_bytes(serialized)
+    print(f"[Rank {rank}] Sending message 1/{iterations}")
+    backend.write_bytes(serialized)
+    print(f"[Rank {rank}] Posting messages 2-{iterations}/{iterations}")
+    reqs = [backend.iwrite_bytes(serialized) for _ in range(iterations - 1)]
+    MPI.Request.Waitall(reqs)
     print(f"[Rank {rank}] Finished sending")
 else:
     print(f"[Rank {rank}] Starting to receive {iterations} messages...")
+    print(f"[Rank {rank}] Waiting for message 1/{iterations}")
+    first = backend.read_bytes()
+    if first is None:
+        print(f"[Rank {rank}] Failed to receive message 1/{iterations}")
+        comm.Abort(1)
+    print(f"[Rank {rank}] Received message 1/{iterations} ({len(first)} bytes)")
+    posted = [backend.iread_bytes(len(first)) for _ in range(iterations - 1)]
+    MPI.Request.Waitall([req for req, _ in posted])
+    for i, (_, buf) in enumerate(posted, start=2):
+        if buf == first:
+            print(f"[Rank {rank}] Received message {i}/{iterations} ({len(buf)} bytes)")
+        else:
+            print(f"[Rank {rank}] Corrupted message {i}/{iterations}")
+    print(f"[Rank {rank}] Finished receiving")
+
+# Streaming mode (as in the benchmark): write_bytes/read_bytes now run on
+# persistent broadcasts, set up once and only restarted for every message
+comm.Barrier()
+backend.prepare_stream(iterations)
+if is_writer:
+    print(f"[Rank {rank}] Streaming {iterations} messages (persistent)...")
+    for _ in range(iterations):
+        backend.write_bytes(serialized)
+    print(f"[Rank {rank}] Finished streaming")
+else:
+    print(f"[Rank {rank}] Consuming {iterations} messages (persistent)...")
     for i in range(iterations):
-        print(f"[Rank {rank}] Waiting for message {i+1}/{iterations}")
-        data = backend.read_bytes()
-        if data:
-            print(f"[Rank {rank}] Received message {i+1}/{iterations} ({len(data)} bytes)")
+        # A view of the reused receive buffer, valid until the next read
+        message = backend.read_bytes()
+        if message is not None and message == first:
+            print(f"[Rank {rank}] Received message {i+1}/{iterations}")
         else:
             print(f"[Rank {rank}] Failed to receive message {i+1}/{iterations}")
-    print(f"[Rank {rank}] Finished receiving")
+    print(f"[Rank {rank}] Finished consuming")
+
+# Dict reads after prepare_stream(): read() keeps blocking broadcasts on
+# every rank, the second read only broadcasts the UNCHANGED marker
+comm.Barrier()
+if is_writer:
+    backend.write(data)
+    print(f"[Rank {rank}] Broadcasting dict reads after streaming...")
+for i in range(2):
+    received = backend.read()
+    if not is_writer:
+        if received == deserialize(first):
+            print(f"[Rank {rank}] Received dict read {i+1}/2")
+        else:
+            print(f"[Rank {rank}] Failed dict read {i+1}/2")
 
 comm.Barrier()
 backend.cleanup()
@@ -0,0 +1,66 @@
+"""Minimal test: SharedMemory reads must not keep the segment from closing."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from ipc_benchmark import SharedMemoryBackend
+from ipc_benchmark.utils import deserialize, generate_test_dict, serialize
+
+failures = 0
+
+
+def check(ok: bool, what: str) -> None:
+    global failures
+    print(f"{'OK' if ok else 'FAILED'}: {what}")
+    failures += not ok
+
+
+def run(name: str, data) -> None:
+    writer = SharedMemoryBackend(size=16 * 1024 * 1024)
+    reader = SharedMemoryBackend(size=16 * 1024 * 1024)
+    writer.initialize(name, True)
+    reader.initialize(name, False)
+
+    writer.write(data)
+    # Kept alive across cleanup(), as a caller holding its result would
+    received = reader.read()
+    same = received.keys() == data.keys() and all(
+        np.array_equal(received[key], value) for key, value in data.items()
+    )
+    check(same, f"{name}: read() returns the written data")
+
+    reader.cleanup()
+    writer.cleanup()
+    check(not Path("/dev/shm", name).exists(), f"{name}: segment unlinked by cleanup()")
+
+
+def check_raw_reads(name: str) -> None:
+    writer = SharedMemoryBackend(size=16 * 1024 * 1024)
+    reader = SharedMemoryBackend(size=16 * 1024 * 1024)
+    writer.initialize(name, True)
+    reader.initialize(name, False)
+
+    data = generate_test_dict(10)
+    writer.write_bytes(serialize(data))
+    check(deserialize(reader.read_bytes()) == data, f"{name}: write_bytes() pickle")
+    writer.write(data)
+    try:
+        reader.read_bytes()
+        check(False, f"{name}: read_bytes() rejects a write() payload")
+    except RuntimeError:
+        check(True, f"{name}: read_bytes() rejects a write() payload")
+
+    reader.cleanup()
+    writer.cleanup()
+
+
+# Columnar payload (generate_test_dict), read without release()
+run("shm_minimal_columnar", generate_test_dict(100))
+# Out-of-band payload: the NumPy array read() returned outlives cleanup()
+run("shm_minimal_oob", {"array": np.arange(100_000)})
+# write_bytes() pickles and write() payloads through read_bytes()
+check_raw_reads("shm_minimal_raw")
+
+sys.exit(1 if failures else 0)